@@ -32,7 +32,7 @@ class FMPClient:
     async def __aenter__(self) -> "FMPClient":
         self._client = httpx.AsyncClient(
             base_url=self._settings.fmp_base_url,
-            timeout=30.0,
+            timeout=self._settings.request_timeout,
         )
         return self
 
@@ -59,7 +59,7 @@ class EODHDClient:
     async def __aenter__(self) -> "EODHDClient":
         self._client = httpx.AsyncClient(
             base_url=self._settings.eodhd_base_url,
-            timeout=30.0,
+            timeout=self._settings.request_timeout,
         )
         return self
 
@@ -17,7 +17,7 @@ class FREDClient:
     async def __aenter__(self) -> "FREDClient":
         self._client = httpx.AsyncClient(
             base_url=self._settings.fred_base_url,
-            timeout=30.0,
+            timeout=self._settings.request_timeout,
         )
         return self
 
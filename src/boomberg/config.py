@@ -27,6 +27,7 @@ class Settings(BaseSettings):
     eodhd_api_key: str = ""
     eodhd_base_url: str = "https://eodhd.com/api"
     refresh_interval: float = 10.0  # seconds between auto-refresh
+    request_timeout: float = 30.0  # seconds before an API request times out
     watchlist_path: str = str(get_default_data_dir() / "watchlists.json")
 
 
@@ -2,6 +2,7 @@
 
 import asyncio
 from datetime import datetime
+from types import MappingProxyType
 from typing import Optional, Union
 
 from rich.console import RenderableType
@@ -16,25 +17,25 @@ from boomberg.api.models import Quote
 
 # Commodity ETF symbols and display names
 COMMODITY_ETFS = ["GLD", "USO", "SLV", "UNG", "DBA", "URA"]
-COMMODITY_NAMES = {
+COMMODITY_NAMES = MappingProxyType({
     "GLD": "Gold",
     "USO": "Oil",
     "SLV": "Silver",
     "UNG": "Nat Gas",
     "DBA": "Agri",
     "URA": "Uranium",
-}
+})
 
 # Sector ETF symbols and display names
 SECTOR_ETFS = ["XLK", "XLF", "XLE", "XLV", "XLY", "XLI"]
-SECTOR_NAMES = {
+SECTOR_NAMES = MappingProxyType({
     "XLK": "Tech",
     "XLF": "Financials",
     "XLE": "Energy",
     "XLV": "Healthcare",
     "XLY": "Consumer",
     "XLI": "Industrials",
-}
+})
 
 # Country display names (including US which uses FMP)
 COUNTRY_NAMES = {
@@ -50,6 +50,9 @@ CATEGORY_ORDER = [
     "Treasuries",
 ]
 
+# Display position of each category, for ordering only the categories present
+_CATEGORY_RANK = {category: rank for rank, category in enumerate(CATEGORY_ORDER)}
+
 
 class PredictionMarketService:
     """Service for fetching and formatting prediction market data."""
@@ -106,21 +109,17 @@ class PredictionMarketService:
         for market in markets:
             if market.series_ticker and market.series_ticker in SERIES_CATEGORIES:
                 category = SERIES_CATEGORIES[market.series_ticker]
-                if category not in grouped:
-                    grouped[category] = []
-                grouped[category].append(market)
+                grouped.setdefault(category, []).append(market)
 
         # Sort each category's markets by volume
-        for category in grouped:
-            grouped[category].sort(key=lambda m: m.volume_24h, reverse=True)
+        for category_markets in grouped.values():
+            category_markets.sort(key=lambda m: m.volume_24h, reverse=True)
 
         # Return in category order
-        ordered: dict[str, list[KalshiMarket]] = {}
-        for category in CATEGORY_ORDER:
-            if category in grouped:
-                ordered[category] = grouped[category]
-
-        return ordered
+        return {
+            category: grouped[category]
+            for category in sorted(grouped, key=lambda c: _CATEGORY_RANK.get(c, len(_CATEGORY_RANK)))
+        }
 
     async def get_market(self, ticker: str) -> KalshiMarket:
         """Get a single market by ticker."""
@@ -0,0 +1,35 @@
+"""Shared number formatting helpers for widgets."""
+
+from functools import lru_cache
+from typing import Optional
+
+# (threshold, suffix) pairs, largest first
+MARKET_CAP_SCALES = ((1e12, "T"), (1e9, "B"), (1e6, "M"))
+VOLUME_SCALES = ((1e9, "B"), (1e6, "M"), (1e3, "K"))
+
+
+def humanize(
+    value: float,
+    scales: tuple[tuple[float, str], ...],
+    precision: int = 2,
+    prefix: str = "",
+) -> Optional[str]:
+    """Format a value with the first scale it reaches, or None if below all."""
+    for threshold, suffix in scales:
+        if value >= threshold:
+            return f"{prefix}{value / threshold:.{precision}f}{suffix}"
+    return None
+
+
+@lru_cache(maxsize=2048)
+def format_market_cap(market_cap: float, currency: str = "$", precision: int = 2) -> str:
+    """Format market cap in human-readable form."""
+    scaled = humanize(market_cap, MARKET_CAP_SCALES, precision, currency)
+    return scaled if scaled is not None else f"{currency}{market_cap:,.0f}"
+
+
+@lru_cache(maxsize=2048)
+def format_volume(volume: float, precision: int = 2) -> str:
+    """Format volume in human-readable form."""
+    scaled = humanize(volume, VOLUME_SCALES, precision)
+    return scaled if scaled is not None else f"{volume:,}"
@@ -11,6 +11,11 @@ from textual.widgets import Static
 from boomberg.services.dashboard import COUNTRY_NAMES
 
 
+def _format_yield(value: Optional[float]) -> str:
+    """Format a yield value as a percentage, or '-' if missing."""
+    return f"{value:.2f}%" if value is not None else "-"
+
+
 class BondsWidget(Static):
     """Widget for displaying bond yields."""
 
@@ -31,20 +36,48 @@ class BondsWidget(Static):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self._snapshot: Optional[dict] = None
+        self._snapshot_rows: list[tuple[str, str, str, str]] = []
         self._detail: Optional[dict] = None
         self._last_updated: Optional[datetime] = None
 
     def update_snapshot(self, snapshot: dict) -> None:
         """Update with international bond snapshot data."""
         self._snapshot = snapshot
+        self._snapshot_rows = self._build_snapshot_rows(snapshot)
         self._detail = None
         self._last_updated = datetime.now()
         self.refresh()
 
+    @staticmethod
+    def _build_snapshot_rows(snapshot: dict) -> list[tuple[str, str, str, str]]:
+        """Build formatted snapshot table rows, US first then by country name."""
+        if not snapshot:
+            return []
+
+        country_name = COUNTRY_NAMES.get
+        ordered_codes = ["US"] + [
+            code for code in sorted(snapshot, key=lambda c: country_name(c, c))
+            if code != "US"
+        ]
+
+        rows = []
+        for code in ordered_codes:
+            if code not in snapshot:
+                continue
+            yields = snapshot[code]
+            rows.append((
+                f"{country_name(code, code)} ({code})",
+                _format_yield(yields.get("1M")),
+                _format_yield(yields.get("5Y")),
+                _format_yield(yields.get("10Y")),
+            ))
+        return rows
+
     def update_detail(self, detail: dict) -> None:
         """Update with country bond detail data."""
         self._detail = detail
         self._snapshot = None
+        self._snapshot_rows = []
         self._last_updated = datetime.now()
         self.refresh()
 
@@ -78,31 +111,8 @@ class BondsWidget(Static):
         table.add_column("5Y", justify="right", width=8)
         table.add_column("10Y", justify="right", width=8)
 
-        # Order countries: US first, then alphabetically by name
-        ordered_codes = ["US"] + [
-            code for code in sorted(
-                self._snapshot.keys(),
-                key=lambda c: COUNTRY_NAMES.get(c, c)
-            )
-            if code != "US"
-        ]
-
-        for code in ordered_codes:
-            if code not in self._snapshot:
-                continue
-            yields = self._snapshot[code]
-            country_name = COUNTRY_NAMES.get(code, code)
-            display_name = f"{country_name} ({code})"
-
-            val_1m = yields.get("1M")
-            val_5y = yields.get("5Y")
-            val_10y = yields.get("10Y")
-
-            str_1m = f"{val_1m:.2f}%" if val_1m is not None else "-"
-            str_5y = f"{val_5y:.2f}%" if val_5y is not None else "-"
-            str_10y = f"{val_10y:.2f}%" if val_10y is not None else "-"
-
-            table.add_row(display_name, str_1m, str_5y, str_10y)
+        for row in self._snapshot_rows:
+            table.add_row(*row)
 
         sections = [table]
         sections.append(Text(""))
@@ -63,11 +63,12 @@ class CommandBar(Static):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self._history = CommandHistory(max_size=self.HISTORY_SIZE)
+        self._input = Input(placeholder="Q AAPL, WEI, TOP, MOST, WB, FXIP, ECST, GP, FA, FI, N, W, S, ? for help")
 
     def compose(self) -> ComposeResult:
         with Horizontal():
             yield Static(">", id="prompt")
-            yield Input(placeholder="Q AAPL, WEI, TOP, MOST, WB, FXIP, ECST, GP, FA, FI, N, W, S, ? for help")
+            yield self._input
 
     @on(Input.Submitted)
     def handle_submit(self, event: Input.Submitted) -> None:
@@ -78,16 +79,16 @@ class CommandBar(Static):
 
         self._history.add(raw)
 
-        parts = raw.split()
-        command = parts[0].upper()
-        args = parts[1:] if len(parts) > 1 else []
+        head, *rest = raw.split(None, 1)
+        command = head.upper()
+        args = rest[0].split() if rest else []
 
         self.post_message(self.CommandSubmitted(command=command, args=args))
         event.input.clear()
 
     def on_key(self, event: Key) -> None:
         """Handle key events for history navigation."""
-        input_widget = self.query_one(Input)
+        input_widget = self._input
 
         if event.key == "up":
             cmd = self._history.previous()
@@ -104,4 +105,4 @@ class CommandBar(Static):
 
     def focus_input(self) -> None:
         """Focus the command input."""
-        self.query_one(Input).focus()
+        self._input.focus()
@@ -4,6 +4,7 @@ from datetime import datetime
 from typing import Optional
 
 from rich.console import Group, RenderableType
+from rich.style import Style
 from rich.table import Table
 from rich.text import Text
 from textual.widgets import Static
@@ -11,6 +12,14 @@ from textual.widgets import Static
 from boomberg.services.portfolio import PortfolioHolding
 from boomberg.ui.widgets.quote_panel import get_currency_symbol
 
+_STYLE_GREEN = Style(color="green")
+_STYLE_RED = Style(color="red")
+
+
+def _signed_style(value: float) -> Style:
+    """Return the gain/loss style for a signed value."""
+    return _STYLE_GREEN if value >= 0 else _STYLE_RED
+
 
 class PortfolioWidget(Static):
     """Widget for displaying portfolio holdings with performance metrics."""
@@ -32,23 +41,81 @@ class PortfolioWidget(Static):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self._holdings: list[PortfolioHolding] = []
+        self._rows: list[tuple] = []
         self._empty_message = "Portfolio is empty. Use 'PA <SYMBOL> <SHARES> <TOTAL_COST>' to add holdings."
         self._last_updated: Optional[datetime] = None
+        self._cached_renderable: Optional[RenderableType] = None
 
     def update_holdings(self, holdings: list[PortfolioHolding]) -> None:
         """Update the displayed holdings."""
         self._holdings = holdings
+        # Sort holdings by value descending
+        self._rows = [
+            self._build_row(h)
+            for h in sorted(holdings, key=lambda h: h.total_value, reverse=True)
+        ]
         self._last_updated = datetime.now()
+        self._cached_renderable = None
         self.refresh()
 
+    def _build_row(self, h: PortfolioHolding) -> tuple:
+        """Build the formatted table cells for a holding."""
+        currency = get_currency_symbol(h.exchange)
+
+        def money(value: float) -> str:
+            return f"{currency}{value:,.0f}"
+
+        gain_style = _signed_style(h.gain_loss)
+        d1_style = _signed_style(h.change_1d_pct)
+        mtd_style = _signed_style(h.change_mtd_pct)
+        ytd_style = _signed_style(h.change_ytd_pct)
+
+        # Format gain/loss (percentage only)
+        gain_sign = "+" if h.gain_loss_percent >= 0 else ""
+        gain_text = f"{gain_sign}{h.gain_loss_percent:.1f}%"
+
+        # Format period changes
+        d1_sign = "+" if h.change_1d_pct >= 0 else ""
+        d1_text = f"{d1_sign}{h.change_1d_pct:.2f}%"
+
+        mtd_sign = "+" if h.change_mtd_pct >= 0 else ""
+        mtd_text = f"{mtd_sign}{h.change_mtd_pct:.1f}%"
+
+        ytd_sign = "+" if h.change_ytd_pct >= 0 else ""
+        ytd_text = f"{ytd_sign}{h.change_ytd_pct:.1f}%"
+
+        # Format shares: show decimals only if fractional
+        if h.shares == int(h.shares):
+            shares_text = f"{int(h.shares):,}"
+        else:
+            shares_text = f"{h.shares:,.4f}".rstrip("0").rstrip(".")
+
+        return (
+            h.symbol,
+            shares_text,
+            money(h.total_cost),
+            money(h.total_value),
+            Text(gain_text, style=gain_style),
+            Text(d1_text, style=d1_style),
+            Text(mtd_text, style=mtd_style),
+            Text(ytd_text, style=ytd_style),
+        )
+
     def set_empty_message(self, message: str) -> None:
         """Set the message shown when portfolio is empty."""
         self._empty_message = message
+        self._cached_renderable = None
 
     def render(self) -> RenderableType:
         """Render the portfolio."""
         self.border_title = "Portfolio"
 
+        if self._cached_renderable is None:
+            self._cached_renderable = self._build_renderable()
+        return self._cached_renderable
+
+    def _build_renderable(self) -> RenderableType:
+        """Build the portfolio table and footer."""
         if not self._holdings:
             return Text(self._empty_message, style="dim italic")
 
@@ -69,46 +136,8 @@ class PortfolioWidget(Static):
         table.add_column("MTD", justify="right", width=10)
         table.add_column("YTD", justify="right", width=10)
 
-        # Sort holdings by value descending
-        sorted_holdings = sorted(self._holdings, key=lambda h: h.total_value, reverse=True)
-
-        for h in sorted_holdings:
-            currency = get_currency_symbol(h.exchange)
-            gain_style = "green" if h.gain_loss >= 0 else "red"
-            d1_style = "green" if h.change_1d_pct >= 0 else "red"
-            mtd_style = "green" if h.change_mtd_pct >= 0 else "red"
-            ytd_style = "green" if h.change_ytd_pct >= 0 else "red"
-
-            # Format gain/loss (percentage only)
-            gain_sign = "+" if h.gain_loss_percent >= 0 else ""
-            gain_text = f"{gain_sign}{h.gain_loss_percent:.1f}%"
-
-            # Format period changes
-            d1_sign = "+" if h.change_1d_pct >= 0 else ""
-            d1_text = f"{d1_sign}{h.change_1d_pct:.2f}%"
-
-            mtd_sign = "+" if h.change_mtd_pct >= 0 else ""
-            mtd_text = f"{mtd_sign}{h.change_mtd_pct:.1f}%"
-
-            ytd_sign = "+" if h.change_ytd_pct >= 0 else ""
-            ytd_text = f"{ytd_sign}{h.change_ytd_pct:.1f}%"
-
-            # Format shares: show decimals only if fractional
-            if h.shares == int(h.shares):
-                shares_text = f"{int(h.shares):,}"
-            else:
-                shares_text = f"{h.shares:,.4f}".rstrip("0").rstrip(".")
-
-            table.add_row(
-                h.symbol,
-                shares_text,
-                f"{currency}{h.total_cost:,.0f}",
-                f"{currency}{h.total_value:,.0f}",
-                Text(gain_text, style=gain_style),
-                Text(d1_text, style=d1_style),
-                Text(mtd_text, style=mtd_style),
-                Text(ytd_text, style=ytd_style),
-            )
+        for row in self._rows:
+            table.add_row(*row)
 
         sections = [table]
         if self._last_updated:
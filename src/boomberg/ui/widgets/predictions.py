@@ -1,9 +1,12 @@
 """Predictions widget for displaying Kalshi prediction markets."""
 
+import re
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Optional
 
 from rich.console import Group, RenderableType
+from rich.style import Style
 from rich.table import Table
 from rich.text import Text
 from textual.widgets import Static
@@ -11,6 +14,169 @@ from textual.widgets import Static
 from boomberg.api.kalshi_models import KalshiMarket
 from boomberg.services.predictions import SERIES_CATEGORIES, CATEGORY_ORDER
 
+_STYLE_GREEN = Style(color="green")
+_STYLE_RED = Style(color="red")
+_STYLE_DIM = Style(dim=True)
+
+_MAX_TITLE_LENGTH = 50
+
+_MONTHS = (
+    "January|February|March|April|May|June|July|August|September|October|November|December"
+)
+
+# Fed market title patterns
+_RE_FED_RESERVE = re.compile(r"^Will the Federal Reserve\s+")
+_RE_FED = re.compile(r"^Will the Fed\s+")
+_RE_FED_MEETING_DATE = re.compile(
+    rf"\s+at their\s+({_MONTHS})\s+(\d{{4}})\s+meeting", re.IGNORECASE
+)
+_RE_FED_MEETING = re.compile(r"\s+at their\s+meeting")
+_RE_FED_RATES_BY = re.compile(r"rates by ")
+
+# CPI market title patterns
+_RE_CPI_RATE = re.compile(r"^Will the rate of CPI inflation be\s+")
+_RE_CORE_CPI_RATE = re.compile(r"^Will the rate of core CPI inflation be\s+", re.IGNORECASE)
+_RE_CPI = re.compile(r"^Will CPI\s+")
+_RE_CORE_CPI = re.compile(r"^Will core CPI\s+", re.IGNORECASE)
+_RE_CPI_YEAR_ENDING = re.compile(r"\s+for the year ending")
+
+# Employment market title patterns
+_RE_U3_RATE = re.compile(r"^Will the unemployment rate \(U-3\) be\s+")
+_RE_UNEMPLOYMENT = re.compile(r"^Will (the )?unemployment\s+", re.IGNORECASE)
+_RE_US_ECONOMY = re.compile(r"^Will (the )?U\.?S\.?\s+(economy\s+)?", re.IGNORECASE)
+_RE_U3_LEFTOVER = re.compile(r"^Rate \(U-3\) be\s+")
+
+# GDP market title patterns
+_RE_US_GDP = re.compile(r"^Will (the )?U\.?S\.?\s+GDP\s+", re.IGNORECASE)
+_RE_GDP = re.compile(r"^Will (the )?GDP\s+", re.IGNORECASE)
+
+# Recession market title patterns
+_RE_US_RECESSION = re.compile(r"^Will (the )?U\.?S\.?\s+(enter\s+a\s+)?", re.IGNORECASE)
+_RE_RECESSION = re.compile(r"^Will (there be\s+a\s+)?", re.IGNORECASE)
+
+# Date context (month names and years)
+_RE_DATE = re.compile(
+    rf"\s*(?:in|by|before|after)?\s*(?P<month>{_MONTHS})\s*(?P<year>\d{{4}})?\??",
+    re.IGNORECASE,
+)
+
+
+def _strip_fed_prefix(title: str) -> str:
+    """Remove common "Will the..." prefixes and filler for Fed markets."""
+    title = _RE_FED_RESERVE.sub("", title)
+    title = _RE_FED.sub("", title)
+    # Convert "at their March 2026 meeting" -> "in March 2026" to preserve date for extraction
+    title = _RE_FED_MEETING_DATE.sub(r" in \1 \2", title)
+    # Remove any remaining "at their meeting" without date
+    title = _RE_FED_MEETING.sub("", title)
+    return _RE_FED_RATES_BY.sub("", title)
+
+
+def _strip_cpi_prefix(title: str) -> str:
+    """Remove common prefixes for CPI markets."""
+    title = _RE_CPI_RATE.sub("", title)
+    title = _RE_CORE_CPI_RATE.sub("", title)
+    title = _RE_CPI.sub("", title)
+    title = _RE_CORE_CPI.sub("", title)
+    # Remove filler phrase "for the year ending"
+    return _RE_CPI_YEAR_ENDING.sub("", title)
+
+
+def _strip_employment_prefix(title: str) -> str:
+    """Remove common prefixes for employment markets."""
+    title = _RE_U3_RATE.sub("U-3 ", title)
+    title = _RE_UNEMPLOYMENT.sub("", title)
+    title = _RE_US_ECONOMY.sub("", title)
+    # Clean up remaining "Rate (U-3) be" patterns
+    return _RE_U3_LEFTOVER.sub("U-3 ", title)
+
+
+def _strip_gdp_prefix(title: str) -> str:
+    """Remove common prefixes for GDP markets."""
+    title = _RE_US_GDP.sub("", title)
+    return _RE_GDP.sub("", title)
+
+
+def _strip_recession_prefix(title: str) -> str:
+    """Remove common prefixes for recession markets."""
+    title = _RE_US_RECESSION.sub("", title)
+    return _RE_RECESSION.sub("", title)
+
+
+_PREFIX_STRIPPERS: dict[str, Callable[[str], str]] = {
+    "KXFED": _strip_fed_prefix,
+    "KXFEDDECISION": _strip_fed_prefix,
+    "KXRATECUT": _strip_fed_prefix,
+    "KXRATECUTCOUNT": _strip_fed_prefix,
+    "KXCPI": _strip_cpi_prefix,
+    "KXCPICORE": _strip_cpi_prefix,
+    "KXCPIYOY": _strip_cpi_prefix,
+    "KXU3": _strip_employment_prefix,
+    "KXPAYROLLS": _strip_employment_prefix,
+    "KXGDP": _strip_gdp_prefix,
+    "KXRECSSNBER": _strip_recession_prefix,
+}
+
+
+@lru_cache(maxsize=4096)
+def _shorten_title(title: str, series_ticker: Optional[str]) -> str:
+    """Shorten title by removing redundant prefixes based on series.
+
+    Results are memoized since market titles rarely change between refreshes.
+
+    Args:
+        title: The full market title
+        series_ticker: The series ticker (e.g., KXFED, KXCPI)
+
+    Returns:
+        A shortened title with common prefixes removed
+    """
+    if not series_ticker:
+        return title
+
+    result = title
+
+    strip_prefix = _PREFIX_STRIPPERS.get(series_ticker)
+    if strip_prefix is not None:
+        result = strip_prefix(result)
+
+    # Extract date context and format nicely: strip every month/year mention
+    # in one pass, remembering the first one for the abbreviated suffix
+    dates: list[tuple[str, Optional[str]]] = []
+
+    def take_date(match: re.Match) -> str:
+        if not dates:
+            dates.append((match.group("month"), match.group("year")))
+        return ""
+
+    result = _RE_DATE.sub(take_date, result)
+
+    if dates:
+        month, year = dates[0]
+        # Abbreviate month
+        month_abbrev = month[:3]
+        result = result.strip().rstrip("?")
+        if year:
+            result = f"{result} ({month_abbrev} {year})"
+        else:
+            result = f"{result} ({month_abbrev})"
+
+    # Capitalize first letter
+    if result and result[0].islower():
+        result = result[0].upper() + result[1:]
+
+    return result.strip()
+
+
+@lru_cache(maxsize=2048)
+def _format_volume(volume: int) -> str:
+    """Format volume in human-readable form."""
+    if volume >= 1_000_000:
+        return f"{volume / 1_000_000:.1f}M"
+    if volume >= 1_000:
+        return f"{volume / 1_000:.1f}K"
+    return str(volume)
+
 
 class PredictionWidget(Static):
     """Widget for displaying prediction market data."""
@@ -34,12 +200,14 @@ class PredictionWidget(Static):
         self._markets: Optional[list[KalshiMarket]] = None
         self._detail: Optional[KalshiMarket] = None
         self._last_updated: Optional[datetime] = None
+        self._cached_renderable: Optional[RenderableType] = None
 
     def update_markets(self, markets: list[KalshiMarket]) -> None:
         """Update with list of markets for overview display."""
         self._markets = markets
         self._detail = None
         self._last_updated = datetime.now()
+        self._cached_renderable = None
         self.refresh()
 
     def update_detail(self, market: KalshiMarket) -> None:
@@ -47,10 +215,17 @@ class PredictionWidget(Static):
         self._detail = market
         self._markets = None
         self._last_updated = datetime.now()
+        self._cached_renderable = None
         self.refresh()
 
     def render(self) -> RenderableType:
         """Render the predictions widget."""
+        if self._cached_renderable is None:
+            self._cached_renderable = self._build_renderable()
+        return self._cached_renderable
+
+    def _build_renderable(self) -> RenderableType:
+        """Build the overview, detail or loading renderable."""
         if self._detail:
             return self._render_detail()
         elif self._markets:
@@ -68,143 +243,36 @@ class PredictionWidget(Static):
         """Format price change with styling."""
         change = market.change_cents
         if change > 0:
-            return Text(f"+{change}c", style="green")
+            return Text(f"+{change}c", style=_STYLE_GREEN)
         elif change < 0:
-            return Text(f"{change}c", style="red")
-        return Text("0c", style="dim")
-
-    def _format_volume(self, volume: int) -> str:
-        """Format volume in human-readable form."""
-        if volume >= 1_000_000:
-            return f"{volume / 1_000_000:.1f}M"
-        if volume >= 1_000:
-            return f"{volume / 1_000:.1f}K"
-        return str(volume)
-
-    def _truncate_title(self, title: str, max_length: int = 50) -> str:
-        """Truncate title to max length with ellipsis."""
-        if len(title) <= max_length:
-            return title
-        return title[: max_length - 3] + "..."
+            return Text(f"{change}c", style=_STYLE_RED)
+        return Text("0c", style=_STYLE_DIM)
 
     def _shorten_title(self, title: str, series_ticker: Optional[str]) -> str:
-        """Shorten title by removing redundant prefixes based on series.
-
-        Args:
-            title: The full market title
-            series_ticker: The series ticker (e.g., KXFED, KXCPI)
-
-        Returns:
-            A shortened title with common prefixes removed
-        """
-        import re
-
-        if not series_ticker:
-            return title
-
-        result = title
-
-        # Remove common "Will the..." prefixes for Fed markets
-        if series_ticker in ("KXFED", "KXFEDDECISION", "KXRATECUT", "KXRATECUTCOUNT"):
-            # Remove "Will the Federal Reserve" prefix
-            result = re.sub(r"^Will the Federal Reserve\s+", "", result)
-            result = re.sub(r"^Will the Fed\s+", "", result)
-            # Convert "at their March 2026 meeting" -> "in March 2026" to preserve date for extraction
-            result = re.sub(
-                r"\s+at their\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})\s+meeting",
-                r" in \1 \2",
-                result,
-                flags=re.IGNORECASE,
-            )
-            # Remove any remaining "at their meeting" without date
-            result = re.sub(r"\s+at their\s+meeting", "", result)
-            result = re.sub(r"rates by ", "", result)
-
-        # Remove common prefixes for CPI markets
-        elif series_ticker in ("KXCPI", "KXCPICORE", "KXCPIYOY"):
-            result = re.sub(r"^Will the rate of CPI inflation be\s+", "", result)
-            result = re.sub(r"^Will the rate of core CPI inflation be\s+", "", result, flags=re.IGNORECASE)
-            result = re.sub(r"^Will CPI\s+", "", result)
-            result = re.sub(r"^Will core CPI\s+", "", result, flags=re.IGNORECASE)
-            # Remove filler phrase "for the year ending"
-            result = re.sub(r"\s+for the year ending", "", result)
-
-        # Remove common prefixes for employment markets
-        elif series_ticker in ("KXU3", "KXPAYROLLS"):
-            result = re.sub(r"^Will the unemployment rate \(U-3\) be\s+", "U-3 ", result)
-            result = re.sub(r"^Will (the )?unemployment\s+", "", result, flags=re.IGNORECASE)
-            result = re.sub(r"^Will (the )?U\.?S\.?\s+(economy\s+)?", "", result, flags=re.IGNORECASE)
-            # Clean up remaining "Rate (U-3) be" patterns
-            result = re.sub(r"^Rate \(U-3\) be\s+", "U-3 ", result)
-
-        # Remove common prefixes for GDP markets
-        elif series_ticker == "KXGDP":
-            result = re.sub(r"^Will (the )?U\.?S\.?\s+GDP\s+", "", result, flags=re.IGNORECASE)
-            result = re.sub(r"^Will (the )?GDP\s+", "", result, flags=re.IGNORECASE)
-
-        # Remove common prefixes for recession markets
-        elif series_ticker == "KXRECSSNBER":
-            result = re.sub(r"^Will (the )?U\.?S\.?\s+(enter\s+a\s+)?", "", result, flags=re.IGNORECASE)
-            result = re.sub(r"^Will (there be\s+a\s+)?", "", result, flags=re.IGNORECASE)
-
-        # Extract date context and format nicely
-        # Look for month names and years
-        date_match = re.search(
-            r"(in|by|before|after)?\s*(January|February|March|April|May|June|July|August|September|October|November|December)\s*(\d{4})?",
-            result,
-            re.IGNORECASE,
-        )
-
-        if date_match:
-            month = date_match.group(2)
-            year = date_match.group(3)
-            # Abbreviate month
-            month_abbrev = month[:3]
-            # Remove the original date from the string and add abbreviated version
-            result = re.sub(
-                r"\s*(in|by|before|after)?\s*(January|February|March|April|May|June|July|August|September|October|November|December)\s*(\d{4})?\??",
-                "",
-                result,
-                flags=re.IGNORECASE,
-            )
-            result = result.strip().rstrip("?")
-            if year:
-                result = f"{result} ({month_abbrev} {year})"
-            else:
-                result = f"{result} ({month_abbrev})"
-
-        # Capitalize first letter
-        if result and result[0].islower():
-            result = result[0].upper() + result[1:]
-
-        return result.strip()
+        """Shorten title by removing redundant prefixes based on series."""
+        return _shorten_title(title, series_ticker)
 
     def _group_markets_by_category(
         self, markets: list[KalshiMarket]
     ) -> dict[str, list[KalshiMarket]]:
         """Group markets by their category."""
-        grouped: dict[str, list[KalshiMarket]] = {}
+        # Seed groups in category order so insertion order is the display order
+        ordered: dict[str, list[KalshiMarket]] = {category: [] for category in CATEGORY_ORDER}
+        other: list[KalshiMarket] = []
+        category_for = SERIES_CATEGORIES.get
         for market in markets:
-            if market.series_ticker and market.series_ticker in SERIES_CATEGORIES:
-                category = SERIES_CATEGORIES[market.series_ticker]
-            else:
-                category = "Other"
-            if category not in grouped:
-                grouped[category] = []
-            grouped[category].append(market)
-
-        # Sort each category's markets by volume
-        for category in grouped:
-            grouped[category].sort(key=lambda m: m.volume_24h, reverse=True)
-
-        # Return in category order
-        ordered: dict[str, list[KalshiMarket]] = {}
-        for category in CATEGORY_ORDER:
-            if category in grouped:
-                ordered[category] = grouped[category]
+            category = category_for(market.series_ticker) if market.series_ticker else None
+            ordered.get(category, other).append(market)
+
+        # Drop empty categories and sort each by volume
+        ordered = {category: group for category, group in ordered.items() if group}
+        for group in ordered.values():
+            group.sort(key=lambda m: m.volume_24h, reverse=True)
+
         # Add any "Other" category at the end
-        if "Other" in grouped:
-            ordered["Other"] = grouped["Other"]
+        if other:
+            other.sort(key=lambda m: m.volume_24h, reverse=True)
+            ordered["Other"] = other
 
         return ordered
 
@@ -242,12 +310,13 @@ class PredictionWidget(Static):
 
             for market in markets:
                 # Use shortened title, then truncate if still too long
-                title = self._shorten_title(market.title, market.series_ticker)
-                title = self._truncate_title(title)
+                title = _shorten_title(market.title, market.series_ticker)
+                if len(title) > _MAX_TITLE_LENGTH:
+                    title = title[: _MAX_TITLE_LENGTH - 3] + "..."
                 yes_price = self._format_price_cents(market.yes_bid)
                 no_price = self._format_price_cents(market.no_bid)
                 change = self._format_change(market)
-                volume = self._format_volume(market.volume_24h)
+                volume = _format_volume(market.volume_24h)
 
                 table.add_row(title, yes_price, no_price, change, volume)
 
@@ -318,8 +387,8 @@ class PredictionWidget(Static):
         activity_table.add_column("Label", width=20)
         activity_table.add_column("Value", width=20)
 
-        volume = self._format_volume(market.volume_24h)
-        open_interest = self._format_volume(market.open_interest) if market.open_interest else "-"
+        volume = _format_volume(market.volume_24h)
+        open_interest = _format_volume(market.open_interest) if market.open_interest else "-"
         status = market.status.capitalize()
         close_time = market.close_time or "-"
 
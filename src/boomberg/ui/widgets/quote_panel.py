@@ -1,7 +1,9 @@
 """Quote display panel widget."""
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional
 
 from rich.console import Group, RenderableType
@@ -10,6 +12,7 @@ from rich.text import Text
 from textual.widgets import Static
 
 from boomberg.api.models import NewsArticle, Quote
+from boomberg.ui.widgets._formatting import format_market_cap, format_volume
 
 
 @dataclass
@@ -21,7 +24,7 @@ class PriceChanges:
     change_10y: float = 0.0
 
 # Exchange to currency symbol mapping
-EXCHANGE_CURRENCY = {
+EXCHANGE_CURRENCY = MappingProxyType({
     # US Exchanges
     "NYSE": "$",
     "NASDAQ": "$",
@@ -78,20 +81,48 @@ EXCHANGE_CURRENCY = {
     # Brazil
     "BOVESPA": "R$",
     "B3": "R$",
+})
+
+
+_EMPTY_QUOTE_TEXT = Text("No quote loaded. Use Q <SYMBOL> to load a quote.", style="dim")
+
+# Lowercased keys for case-insensitive and partial matching, built once at import.
+# Partial matching tries the longest keys first so the most specific name wins.
+_EXCHANGE_CURRENCY_LOWER = {key.lower(): symbol for key, symbol in EXCHANGE_CURRENCY.items()}
+_EXCHANGE_LOWER_KEYS = tuple(
+    sorted(_EXCHANGE_CURRENCY_LOWER.items(), key=lambda item: len(item[0]), reverse=True)
+)
+# First three characters of each key, so "Toronto Stock Exchange" resolves
+# with one dict probe instead of a substring scan
+_EXCHANGE_PREFIX = {
+    key_lower[:3]: symbol
+    for key_lower, symbol in _EXCHANGE_CURRENCY_LOWER.items()
+    if len(key_lower) >= 3
 }
 
 
+@lru_cache(maxsize=256)
 def get_currency_symbol(exchange: str) -> str:
     """Get currency symbol for an exchange."""
     if not exchange:
         return "$"
     # Check direct match
-    if exchange in EXCHANGE_CURRENCY:
-        return EXCHANGE_CURRENCY[exchange]
-    # Check partial matches (exchange names can vary)
+    symbol = EXCHANGE_CURRENCY.get(exchange)
+    if symbol is not None:
+        return symbol
+    # Check case-insensitive match
     exchange_lower = exchange.lower()
-    for key, symbol in EXCHANGE_CURRENCY.items():
-        if key.lower() in exchange_lower or exchange_lower in key.lower():
+    symbol = _EXCHANGE_CURRENCY_LOWER.get(exchange_lower)
+    if symbol is not None:
+        return symbol
+    # Check prefix match
+    if len(exchange_lower) >= 3:
+        symbol = _EXCHANGE_PREFIX.get(exchange_lower[:3])
+        if symbol is not None:
+            return symbol
+    # Check partial matches (exchange names can vary)
+    for key_lower, symbol in _EXCHANGE_LOWER_KEYS:
+        if key_lower in exchange_lower or exchange_lower in key_lower:
             return symbol
     # Default to USD
     return "$"
@@ -121,8 +152,11 @@ class QuotePanel(Static):
     def __init__(self, quote: Optional[Quote] = None, **kwargs) -> None:
         super().__init__(**kwargs)
         self._quote = quote
+        self._currency = get_currency_symbol(quote.exchange) if quote else "$"
         self._price_changes: Optional[PriceChanges] = None
         self._news: list[NewsArticle] = []
+        self._rows: list[tuple] = self._build_rows() if quote else []
+        self._cached_renderable: Optional[RenderableType] = None
 
     def update_quote(
         self,
@@ -132,8 +166,11 @@ class QuotePanel(Static):
     ) -> None:
         """Update the displayed quote."""
         self._quote = quote
+        self._currency = get_currency_symbol(quote.exchange)
         self._price_changes = price_changes
         self._news = news[:3] if news else []
+        self._rows = self._build_rows()
+        self._cached_renderable = None
         self.remove_class("up", "down")
         if quote.change > 0:
             self.add_class("up")
@@ -143,17 +180,40 @@ class QuotePanel(Static):
 
     def render(self) -> RenderableType:
         """Render the quote panel."""
+        if self._cached_renderable is None:
+            self._cached_renderable = self._build_renderable()
+        return self._cached_renderable
+
+    def _build_renderable(self) -> RenderableType:
+        """Build the quote table and news section."""
         if self._quote is None:
-            return Text("No quote loaded. Use Q <SYMBOL> to load a quote.", style="dim")
+            return _EMPTY_QUOTE_TEXT
+
+        table = Table(show_header=False, box=None, padding=(0, 2, 0, 0))
+        table.add_column("Label", style="bold cyan")
+        table.add_column("Value", style="white")
 
+        for row in self._rows:
+            table.add_row(*row)
+
+        # Add news section if we have news
+        if self._news:
+            renderables = [table, Text(""), self._render_news()]
+            return Group(*renderables)
+
+        return table
+
+    def _build_rows(self) -> list[tuple]:
+        """Build the formatted label/value rows for the current quote."""
         q = self._quote
         change_style = "green" if q.change >= 0 else "red"
         sign = "+" if q.change >= 0 else ""
-        currency = get_currency_symbol(q.exchange)
+        currency = self._currency
 
-        table = Table(show_header=False, box=None, padding=(0, 2, 0, 0))
-        table.add_column("Label", style="bold cyan")
-        table.add_column("Value", style="white")
+        def money(value: float) -> str:
+            return f"{currency}{value:,.2f}"
+
+        rows: list[tuple] = []
 
         # Header with symbol and name
         header = Text()
@@ -163,22 +223,22 @@ class QuotePanel(Static):
 
         # Price and change
         price_text = Text()
-        price_text.append(f"{currency}{q.price:,.2f}", style="bold white")
+        price_text.append(money(q.price), style="bold white")
         price_text.append(f"  {sign}{q.change:,.2f} ({sign}{q.change_percent:.2f}%)", style=change_style)
 
-        table.add_row("", header)
-        table.add_row("Price", price_text)
-        table.add_row("Day Range", f"{currency}{q.day_low:,.2f} - {currency}{q.day_high:,.2f}")
-        table.add_row("52W Range", f"{currency}{q.year_low:,.2f} - {currency}{q.year_high:,.2f}")
-        table.add_row("Volume", self._format_volume(q.volume))
-        table.add_row("Avg Volume", self._format_volume(q.avg_volume))
+        rows.append(("", header))
+        rows.append(("Price", price_text))
+        rows.append(("Day Range", f"{money(q.day_low)} - {money(q.day_high)}"))
+        rows.append(("52W Range", f"{money(q.year_low)} - {money(q.year_high)}"))
+        rows.append(("Volume", format_volume(q.volume)))
+        rows.append(("Avg Volume", format_volume(q.avg_volume)))
 
         if q.market_cap:
-            table.add_row("Market Cap", self._format_market_cap(q.market_cap, currency))
+            rows.append(("Market Cap", format_market_cap(q.market_cap, currency)))
         if q.pe:
-            table.add_row("P/E Ratio", f"{q.pe:.2f}")
+            rows.append(("P/E Ratio", f"{q.pe:.2f}"))
         if q.eps:
-            table.add_row("EPS", f"{currency}{q.eps:.2f}")
+            rows.append(("EPS", f"{currency}{q.eps:.2f}"))
 
         # Price changes over time
         if self._price_changes:
@@ -191,17 +251,12 @@ class QuotePanel(Static):
             changes_text.append(self._format_change("5Y", pc.change_5y))
             changes_text.append("  ")
             changes_text.append(self._format_change("10Y", pc.change_10y))
-            table.add_row("Performance", changes_text)
+            rows.append(("Performance", changes_text))
 
         if q.exchange:
-            table.add_row("Exchange", q.exchange)
-
-        # Add news section if we have news
-        if self._news:
-            renderables = [table, Text(""), self._render_news()]
-            return Group(*renderables)
+            rows.append(("Exchange", q.exchange))
 
-        return table
+        return rows
 
     def _format_change(self, label: str, value: float) -> Text:
         """Format a labeled percentage change."""
@@ -212,26 +267,6 @@ class QuotePanel(Static):
         text.append(f"{sign}{value:.1f}%", style=style)
         return text
 
-    def _format_market_cap(self, market_cap: float, currency: str = "$") -> str:
-        """Format market cap in human-readable form."""
-        if market_cap >= 1e12:
-            return f"{currency}{market_cap / 1e12:.2f}T"
-        if market_cap >= 1e9:
-            return f"{currency}{market_cap / 1e9:.2f}B"
-        if market_cap >= 1e6:
-            return f"{currency}{market_cap / 1e6:.2f}M"
-        return f"{currency}{market_cap:,.0f}"
-
-    def _format_volume(self, volume: int) -> str:
-        """Format volume in human-readable form."""
-        if volume >= 1e9:
-            return f"{volume / 1e9:.2f}B"
-        if volume >= 1e6:
-            return f"{volume / 1e6:.2f}M"
-        if volume >= 1e3:
-            return f"{volume / 1e3:.2f}K"
-        return f"{volume:,}"
-
     def _render_news(self) -> Table:
         """Render news headlines section."""
         table = Table(show_header=False, box=None, padding=(0, 2, 0, 0))
@@ -239,12 +274,13 @@ class QuotePanel(Static):
 
         table.add_row(Text("News", style="bold cyan"))
 
+        now = datetime.now(timezone.utc)
         for article in self._news:
             # Title
             table.add_row(Text(article.title, style="white"))
 
             # Source (clickable) and time
-            time_str = self._format_relative_time(article.published_date)
+            time_str = self._format_relative_time(article.published_date, now)
             if article.url:
                 source_text = Text(article.site, style="dim")
                 source_text.stylize(f"link {article.url}")
@@ -258,12 +294,15 @@ class QuotePanel(Static):
 
         return table
 
-    def _format_relative_time(self, published_date: datetime) -> str:
-        """Format published date as relative time."""
+    def _format_relative_time(self, published_date: datetime, now: datetime) -> str:
+        """Format published date as relative time.
+
+        Args:
+            published_date: When the article was published (naive UTC or aware)
+            now: Current time as an aware UTC datetime, captured once per render
+        """
         if published_date.tzinfo is None:
-            now = datetime.utcnow()
-        else:
-            now = datetime.now(published_date.tzinfo)
+            now = now.replace(tzinfo=None)
         diff = now - published_date
 
         if diff.total_seconds() < 0:
@@ -11,6 +11,51 @@ from textual.widgets import Static
 from boomberg.api.models import Quote
 from boomberg.services.dashboard import COMMODITY_NAMES, SECTOR_NAMES
 
+# Index symbols per region, in display order
+_REGION_INDEX_SYMBOLS = (
+    ("^GSPC", "^DJI", "^IXIC", "^RUT"),
+    ("^FTSE", "^GDAXI", "^FCHI", "^STOXX50E"),
+    ("^N225", "^HSI", "^KS11", "^AXJO"),
+)
+
+_INDEX_NAMES = {
+    "^GSPC": "S&P 500", "^DJI": "Dow Jones", "^IXIC": "NASDAQ", "^RUT": "Russell 2000",
+    "^FTSE": "FTSE 100", "^GDAXI": "DAX", "^FCHI": "CAC 40", "^STOXX50E": "Euro STOXX",
+    "^N225": "Nikkei 225", "^HSI": "Hang Seng", "^KS11": "KOSPI", "^AXJO": "ASX 200",
+}
+
+# Key alternatives for matching FMP treasury response, in order of preference
+_BOND_KEY_ALTERNATIVES = {
+    "2Y": ("year2", "twoYear", "2Y", "y2", "year_2", "2year"),
+    "5Y": ("year5", "fiveYear", "5Y", "y5", "year_5", "5year"),
+    "10Y": ("year10", "tenYear", "10Y", "y10", "year_10", "10year"),
+    "30Y": ("year30", "thirtyYear", "30Y", "y30", "year_30", "30year"),
+}
+
+# Reverse index: response key -> (tenor label, preference)
+_BOND_KEY_TO_TENOR = {
+    key: (label, preference)
+    for label, keys in _BOND_KEY_ALTERNATIVES.items()
+    for preference, key in enumerate(keys)
+}
+
+
+def _extract_treasury_yields(bonds: dict) -> dict[str, float]:
+    """Map a treasury response onto tenor labels in a single pass.
+
+    When several alternative keys for a tenor are present, the most
+    preferred one wins.
+    """
+    found: dict[str, tuple[int, float]] = {}
+    for key, value in bonds.items():
+        tenor = _BOND_KEY_TO_TENOR.get(key)
+        if tenor is None or value is None:
+            continue
+        label, preference = tenor
+        if label not in found or preference < found[label][0]:
+            found[label] = (preference, value)
+    return {label: value for label, (_, value) in found.items()}
+
 
 class SnapshotWidget(Static):
     """Widget for displaying market snapshot."""
@@ -32,10 +77,12 @@ class SnapshotWidget(Static):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self._indices: list[Quote] = []
+        self._regional_indices: list[list[Optional[Quote]]] = []
         self._commodities: list[Quote] = []
         self._sectors: list[Quote] = []
         self._bonds: dict = {}
         self._last_updated: Optional[datetime] = None
+        self._cached_renderable: Optional[RenderableType] = None
 
     def update_snapshot(
         self,
@@ -46,10 +93,17 @@ class SnapshotWidget(Static):
     ) -> None:
         """Update the snapshot data."""
         self._indices = indices
+        # Partition indices by region once, in display order
+        index_map = {q.symbol: q for q in indices}
+        self._regional_indices = [
+            [index_map.get(symbol) for symbol in symbols]
+            for symbols in _REGION_INDEX_SYMBOLS
+        ]
         self._commodities = commodities
         self._sectors = sectors
         self._bonds = bonds
         self._last_updated = datetime.now()
+        self._cached_renderable = None
         self.refresh()
 
     def render(self) -> RenderableType:
@@ -57,6 +111,12 @@ class SnapshotWidget(Static):
         today = datetime.now().strftime("%b %d, %Y")
         self.border_title = f"Market Snapshot - {today}"
 
+        if self._cached_renderable is None:
+            self._cached_renderable = self._build_renderable()
+        return self._cached_renderable
+
+    def _build_renderable(self) -> RenderableType:
+        """Build the snapshot tables and footer."""
         if not self._indices and not self._commodities and not self._sectors:
             return Text("Loading market snapshot...", style="dim italic")
 
@@ -103,58 +163,18 @@ class SnapshotWidget(Static):
         table.add_column("Asia Equities", ratio=1)
         table.add_column("1D", justify="right", width=8)
 
-        # Group indices by region
-        us_symbols = ["^GSPC", "^DJI", "^IXIC", "^RUT"]
-        eu_symbols = ["^FTSE", "^GDAXI", "^FCHI", "^STOXX50E"]
-        asia_symbols = ["^N225", "^HSI", "^KS11", "^AXJO"]
-
-        name_map = {
-            "^GSPC": "S&P 500", "^DJI": "Dow Jones", "^IXIC": "NASDAQ", "^RUT": "Russell 2000",
-            "^FTSE": "FTSE 100", "^GDAXI": "DAX", "^FCHI": "CAC 40", "^STOXX50E": "Euro STOXX",
-            "^N225": "Nikkei 225", "^HSI": "Hang Seng", "^KS11": "KOSPI", "^AXJO": "ASX 200",
-        }
-
-        def get_indices_for_region(symbols: list[str]) -> list[Optional[Quote]]:
-            """Get indices in the order specified by symbols list."""
-            result = []
-            for symbol in symbols:
-                quote = next((q for q in self._indices if q.symbol == symbol), None)
-                result.append(quote)
-            return result
-
-        us_indices = get_indices_for_region(us_symbols)
-        eu_indices = get_indices_for_region(eu_symbols)
-        asia_indices = get_indices_for_region(asia_symbols)
-
         # Build rows - one index from each region per row
-        max_rows = max(len(us_indices), len(eu_indices), len(asia_indices))
+        max_rows = max(len(region) for region in self._regional_indices)
 
         for i in range(max_rows):
             row = []
-
-            # US column
-            if i < len(us_indices) and us_indices[i]:
-                q = us_indices[i]
-                row.append(name_map.get(q.symbol, q.symbol))
-                row.append(self._format_change(q.change_percent))
-            else:
-                row.extend(["", ""])
-
-            # EU column
-            if i < len(eu_indices) and eu_indices[i]:
-                q = eu_indices[i]
-                row.append(name_map.get(q.symbol, q.symbol))
-                row.append(self._format_change(q.change_percent))
-            else:
-                row.extend(["", ""])
-
-            # Asia column
-            if i < len(asia_indices) and asia_indices[i]:
-                q = asia_indices[i]
-                row.append(name_map.get(q.symbol, q.symbol))
-                row.append(self._format_change(q.change_percent))
-            else:
-                row.extend(["", ""])
+            for region in self._regional_indices:
+                q = region[i] if i < len(region) else None
+                if q:
+                    row.append(_INDEX_NAMES.get(q.symbol, q.symbol))
+                    row.append(self._format_change(q.change_percent))
+                else:
+                    row.extend(["", ""])
 
             table.add_row(*row)
 
@@ -222,24 +242,11 @@ class SnapshotWidget(Static):
         table.add_column("30Y", justify="center", ratio=1)
         table.add_column("Spread (10Y-2Y)", justify="center", ratio=1)
 
-        # Key alternatives for matching FMP response
-        key_alternatives = {
-            "2Y": ["year2", "twoYear", "2Y", "y2", "year_2", "2year"],
-            "5Y": ["year5", "fiveYear", "5Y", "y5", "year_5", "5year"],
-            "10Y": ["year10", "tenYear", "10Y", "y10", "year_10", "10year"],
-            "30Y": ["year30", "thirtyYear", "30Y", "y30", "year_30", "30year"],
-        }
-
-        def get_yield(label: str) -> float | None:
-            for key in key_alternatives.get(label, []):
-                if key in self._bonds and self._bonds[key] is not None:
-                    return self._bonds[key]
-            return None
-
-        y2 = get_yield("2Y")
-        y5 = get_yield("5Y")
-        y10 = get_yield("10Y")
-        y30 = get_yield("30Y")
+        yields = _extract_treasury_yields(self._bonds)
+        y2 = yields.get("2Y")
+        y5 = yields.get("5Y")
+        y10 = yields.get("10Y")
+        y30 = yields.get("30Y")
 
         # Calculate spread
         spread_text = Text("-")
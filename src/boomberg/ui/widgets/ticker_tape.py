@@ -6,6 +6,8 @@ from textual.widgets import Static
 
 from boomberg.api.models import Quote
 
+_EMPTY_TAPE = Text("No market data", style="dim")
+
 
 class TickerTape(Static):
     """Scrolling ticker tape showing quotes."""
@@ -25,16 +27,22 @@ class TickerTape(Static):
         super().__init__(**kwargs)
         self._quotes: list[Quote] = []
         self._offset: int = 0
+        self._tape: Text = _EMPTY_TAPE
 
     def update_quotes(self, quotes: list[Quote]) -> None:
         """Update the quotes displayed in the ticker."""
         self._quotes = quotes
+        self._tape = self._build_tape()
         self.refresh()
 
     def render(self) -> RenderableType:
         """Render the ticker tape."""
+        return self._tape
+
+    def _build_tape(self) -> Text:
+        """Build the ticker text for the current quotes."""
         if not self._quotes:
-            return Text("No market data", style="dim")
+            return _EMPTY_TAPE
 
         tape = Text()
         for i, quote in enumerate(self._quotes):
@@ -5,6 +5,7 @@ from datetime import datetime
 from typing import Optional, Union
 
 from rich.console import Group, RenderableType
+from rich.style import Style
 from rich.table import Table
 from rich.text import Text
 from textual.message import Message
@@ -12,7 +13,11 @@ from textual.widgets import Static
 
 from boomberg.api.models import Quote
 from boomberg.services.watchlist import WatchlistQuote
-from boomberg.ui.widgets.quote_panel import get_currency_symbol
+from boomberg.ui.widgets._formatting import format_market_cap, format_volume
+
+# Shared Style objects so Rich does not parse style strings per cell
+_STYLE_GREEN = Style(color="green")
+_STYLE_RED = Style(color="red")
 
 
 class WatchlistWidget(Static):
@@ -47,25 +52,38 @@ class WatchlistWidget(Static):
         super().__init__(**kwargs)
         self._name = name
         self._quotes: list[Union[Quote, WatchlistQuote]] = []
+        self._rows: list[tuple] = []
         self._empty_message = "Watchlist is empty. Use 'WA <SYMBOL>' to add symbols."
+        self._empty_text = Text(self._empty_message, style="dim italic")
         self._last_updated: Optional[datetime] = None
+        self._cached_renderable: Optional[RenderableType] = None
 
     def update_quotes(self, quotes: list[Union[Quote, WatchlistQuote]]) -> None:
         """Update the displayed quotes."""
         self._quotes = quotes
+        self._rows = [self._build_row(quote) for quote in quotes]
         self._last_updated = datetime.now()
+        self._cached_renderable = None
         self.refresh()
 
     def set_empty_message(self, message: str) -> None:
         """Set the message shown when watchlist is empty."""
         self._empty_message = message
+        self._empty_text = Text(message, style="dim italic")
+        self._cached_renderable = None
 
     def render(self) -> RenderableType:
         """Render the watchlist."""
         self.border_title = self._name
 
+        if self._cached_renderable is None:
+            self._cached_renderable = self._build_renderable()
+        return self._cached_renderable
+
+    def _build_renderable(self) -> RenderableType:
+        """Build the watchlist table and footer."""
         if not self._quotes:
-            return Text(self._empty_message, style="dim italic")
+            return self._empty_text
 
         table = Table(
             box=None,
@@ -82,33 +100,8 @@ class WatchlistWidget(Static):
         table.add_column("3Y", justify="right", width=8)
         table.add_column("Volume", justify="right", width=10)
 
-        for quote in self._quotes:
-            # Get price change values (handle both Quote and WatchlistQuote)
-            if isinstance(quote, WatchlistQuote):
-                change_1d = quote.change_1d
-                change_1m = quote.change_1m
-                change_ytd = quote.change_ytd
-                change_3y = quote.change_3y
-                market_cap = quote.market_cap
-                pe = quote.pe
-            else:
-                change_1d = quote.change_percent
-                change_1m = 0.0
-                change_ytd = 0.0
-                change_3y = 0.0
-                market_cap = quote.market_cap
-                pe = quote.pe
-
-            table.add_row(
-                quote.symbol,
-                self._format_market_cap(market_cap),
-                self._format_pe(pe),
-                self._format_change(change_1d),
-                self._format_change(change_1m),
-                self._format_change(change_ytd),
-                self._format_change(change_3y),
-                self._format_volume(quote.volume),
-            )
+        for row in self._rows:
+            table.add_row(*row)
 
         sections = [table]
         if self._last_updated:
@@ -118,36 +111,23 @@ class WatchlistWidget(Static):
 
         return Group(*sections)
 
-    def _format_change(self, value: float) -> Text:
-        """Format a percentage change with color."""
-        style = "green" if value >= 0 else "red"
-        sign = "+" if value >= 0 else ""
-        return Text(f"{sign}{value:.1f}%", style=style)
-
-    def _format_market_cap(self, market_cap: float | None) -> str:
-        """Format market cap in human-readable form."""
-        if market_cap is None:
-            return "-"
-        if market_cap >= 1e12:
-            return f"${market_cap / 1e12:.1f}T"
-        if market_cap >= 1e9:
-            return f"${market_cap / 1e9:.1f}B"
-        if market_cap >= 1e6:
-            return f"${market_cap / 1e6:.1f}M"
-        return f"${market_cap:,.0f}"
-
-    def _format_pe(self, pe: float | None) -> str:
-        """Format PE ratio."""
-        if pe is None:
-            return "-"
-        return f"{pe:.1f}"
-
-    def _format_volume(self, volume: int) -> str:
-        """Format volume in human-readable form."""
-        if volume >= 1e9:
-            return f"{volume / 1e9:.1f}B"
-        if volume >= 1e6:
-            return f"{volume / 1e6:.1f}M"
-        if volume >= 1e3:
-            return f"{volume / 1e3:.1f}K"
-        return f"{volume:,}"
+    def _build_row(self, quote: Union[Quote, WatchlistQuote]) -> tuple:
+        """Build the formatted table cells for a quote in one pass."""
+        # Get price change values; only WatchlistQuote carries period changes
+        change_1m = getattr(quote, "change_1m", None)
+        if change_1m is not None:
+            changes = (quote.change_1d, change_1m, quote.change_ytd, quote.change_3y)
+        else:
+            changes = (quote.change_percent, 0.0, 0.0, 0.0)
+
+        pe = quote.pe
+        return (
+            quote.symbol,
+            format_market_cap(quote.market_cap, precision=1) if quote.market_cap is not None else "-",
+            f"{pe:.1f}" if pe is not None else "-",
+            *(
+                Text(f"{value:+.1f}%", style=_STYLE_GREEN if value >= 0 else _STYLE_RED)
+                for value in changes
+            ),
+            format_volume(quote.volume, precision=1),
+        )
@@ -4,8 +4,19 @@ import pytest
 
 from boomberg.config import Settings
 
+try:
+    import uvloop
+except ImportError:  # not installed, e.g. on Windows where uvloop is unsupported
+    uvloop = None
 
-@pytest.fixture
+if uvloop is not None:
+
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop where it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(scope="session")
 def test_settings() -> Settings:
     """Create test settings with dummy API key."""
     return Settings(
@@ -13,12 +24,15 @@ def test_settings() -> Settings:
         fmp_base_url="https://financialmodelingprep.com/stable",
         fred_api_key="test_fred_key",
         fred_base_url="https://api.stlouisfed.org/fred",
+        eodhd_api_key="test_eodhd_key",
+        eodhd_base_url="https://eodhd.com/api",
         refresh_interval=10.0,
+        request_timeout=1.0,
         watchlist_path="test_watchlists.json",
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_quote_data() -> dict:
     """Sample quote API response data."""
     return {
@@ -42,7 +56,7 @@ def sample_quote_data() -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_historical_data() -> list[dict]:
     """Sample historical price API response data."""
     return [
@@ -67,7 +81,7 @@ def sample_historical_data() -> list[dict]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_profile_data() -> dict:
     """Sample company profile API response data."""
     return {
@@ -91,7 +105,7 @@ def sample_profile_data() -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_news_data() -> list[dict]:
     """Sample news API response data."""
     return [
@@ -107,7 +121,7 @@ def sample_news_data() -> list[dict]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_search_data() -> list[dict]:
     """Sample search API response data."""
     return [
@@ -0,0 +1,227 @@
+"""Shared fixtures for API client tests."""
+
+import json
+from collections.abc import AsyncIterator
+
+import pytest
+import pytest_asyncio
+
+from boomberg.api.client import FMPClient
+from boomberg.api.eodhd_client import EODHDClient
+from boomberg.api.fred_client import FREDClient
+from boomberg.api.kalshi_client import KalshiClient
+from boomberg.config import Settings
+
+
+@pytest.fixture(scope="session")
+def fmp_client(test_settings: Settings) -> FMPClient:
+    """Create FMP client shared across API tests."""
+    return FMPClient(settings=test_settings)
+
+
+@pytest.fixture(scope="session")
+def eodhd_client(test_settings: Settings) -> EODHDClient:
+    """Create EODHDClient shared across API tests."""
+    return EODHDClient(test_settings)
+
+
+@pytest.fixture(scope="session")
+def fred_client(test_settings: Settings) -> FREDClient:
+    """Create FREDClient shared across API tests."""
+    return FREDClient(test_settings)
+
+
+@pytest.fixture(scope="session")
+def kalshi_client() -> KalshiClient:
+    """Create Kalshi client shared across API tests."""
+    return KalshiClient()
+
+
+@pytest.fixture(scope="session")
+def sample_kalshi_market_data() -> dict:
+    """Sample Kalshi market API response data."""
+    return {
+        "ticker": "FED-25MAR-T4.75",
+        "title": "Will the Fed cut rates in March 2025?",
+        "yes_bid": 62,
+        "no_bid": 36,
+        "yes_ask": 64,
+        "no_ask": 38,
+        "last_price": 63,
+        "previous_price": 60,
+        "volume_24h": 125400,
+        "open_interest": 450200,
+        "status": "active",
+        "close_time": "2025-03-15T16:00:00Z",
+    }
+
+
+@pytest.fixture(scope="session")
+def sample_kalshi_markets_response(sample_kalshi_market_data) -> dict:
+    """Sample Kalshi markets list API response."""
+    return {
+        "markets": [
+            sample_kalshi_market_data,
+            {
+                "ticker": "BTC-100K-EOY",
+                "title": "Will BTC hit $100K by EOY?",
+                "yes_bid": 45,
+                "no_bid": 53,
+                "yes_ask": 47,
+                "no_ask": 55,
+                "last_price": 45,
+                "previous_price": 47,
+                "volume_24h": 89200,
+                "open_interest": 320000,
+                "status": "active",
+                "close_time": "2025-12-31T23:59:59Z",
+            },
+        ],
+        "cursor": None,
+    }
+
+
+@pytest.fixture(scope="session")
+def sample_events_response() -> dict:
+    """Sample events list API response."""
+    return {
+        "events": [
+            {"event_ticker": "KXFED-25MAR", "title": "Fed March 2025"},
+            {"event_ticker": "KXBTC-100K", "title": "BTC 100K"},
+        ]
+    }
+
+
+@pytest.fixture(scope="session")
+def sample_income_statement_data() -> list[dict]:
+    """Sample income statement API response."""
+    return [
+        {
+            "date": "2024-09-30",
+            "symbol": "AAPL",
+            "period": "FY",
+            "fiscalYear": "2024",
+            "revenue": 400000000000,
+            "costOfRevenue": 220000000000,
+            "grossProfit": 180000000000,
+            "operatingExpenses": 60000000000,
+            "operatingIncome": 120000000000,
+            "incomeBeforeTax": 125000000000,
+            "netIncome": 100000000000,
+            "eps": 6.50,
+            "epsDiluted": 6.45,
+            "ebitda": 130000000000,
+        },
+        {
+            "date": "2023-09-30",
+            "symbol": "AAPL",
+            "period": "FY",
+            "fiscalYear": "2023",
+            "revenue": 380000000000,
+            "costOfRevenue": 210000000000,
+            "grossProfit": 170000000000,
+            "operatingExpenses": 55000000000,
+            "operatingIncome": 115000000000,
+            "incomeBeforeTax": 118000000000,
+            "netIncome": 95000000000,
+            "eps": 6.10,
+            "epsDiluted": 6.05,
+            "ebitda": 125000000000,
+        },
+    ]
+
+
+@pytest.fixture(scope="session")
+def sample_balance_sheet_data() -> list[dict]:
+    """Sample balance sheet API response."""
+    return [
+        {
+            "date": "2024-09-30",
+            "symbol": "AAPL",
+            "period": "FY",
+            "fiscalYear": "2024",
+            "totalAssets": 350000000000,
+            "totalCurrentAssets": 140000000000,
+            "cashAndCashEquivalents": 30000000000,
+            "shortTermInvestments": 35000000000,
+            "netReceivables": 25000000000,
+            "inventory": 5000000000,
+            "totalNonCurrentAssets": 210000000000,
+            "propertyPlantEquipmentNet": 45000000000,
+            "goodwill": 0,
+            "intangibleAssets": 0,
+            "totalLiabilities": 280000000000,
+            "totalCurrentLiabilities": 150000000000,
+            "accountPayables": 60000000000,
+            "shortTermDebt": 10000000000,
+            "totalNonCurrentLiabilities": 130000000000,
+            "longTermDebt": 100000000000,
+            "totalStockholdersEquity": 70000000000,
+            "retainedEarnings": 5000000000,
+            "commonStock": 65000000000,
+            "totalDebt": 110000000000,
+            "netDebt": 80000000000,
+        },
+    ]
+
+
+@pytest.fixture(scope="session")
+def sample_cash_flow_data() -> list[dict]:
+    """Sample cash flow statement API response."""
+    return [
+        {
+            "date": "2024-09-30",
+            "symbol": "AAPL",
+            "period": "FY",
+            "fiscalYear": "2024",
+            "netIncome": 100000000000,
+            "depreciationAndAmortization": 12000000000,
+            "stockBasedCompensation": 10000000000,
+            "changeInWorkingCapital": -5000000000,
+            "operatingCashFlow": 115000000000,
+            "capitalExpenditure": -10000000000,
+            "investmentsInPropertyPlantAndEquipment": -10000000000,
+            "acquisitionsNet": 0,
+            "purchasesOfInvestments": -40000000000,
+            "salesMaturitiesOfInvestments": 50000000000,
+            "investingCashFlow": 0,
+            "debtRepayment": -10000000000,
+            "commonStockRepurchased": -80000000000,
+            "dividendsPaid": -15000000000,
+            "financingCashFlow": -105000000000,
+            "netChangeInCash": 10000000000,
+            "freeCashFlow": 105000000000,
+        },
+    ]
+
+
+@pytest.fixture(scope="session")
+def sample_income_statement_json(sample_income_statement_data) -> bytes:
+    """Income statement sample encoded once as a JSON response body."""
+    return json.dumps(sample_income_statement_data).encode()
+
+
+@pytest.fixture(scope="session")
+def sample_balance_sheet_json(sample_balance_sheet_data) -> bytes:
+    """Balance sheet sample encoded once as a JSON response body."""
+    return json.dumps(sample_balance_sheet_data).encode()
+
+
+@pytest.fixture(scope="session")
+def sample_cash_flow_json(sample_cash_flow_data) -> bytes:
+    """Cash flow sample encoded once as a JSON response body."""
+    return json.dumps(sample_cash_flow_data).encode()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def entered_fmp_client(test_settings: Settings) -> AsyncIterator[FMPClient]:
+    """FMP client entered once and kept open for the whole session."""
+    async with FMPClient(settings=test_settings) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def entered_kalshi_client() -> AsyncIterator[KalshiClient]:
+    """Kalshi client entered once and kept open for the whole session."""
+    async with KalshiClient() as client:
+        yield client
@@ -0,0 +1,50 @@
+"""Lightweight HTTP client stubs for API client tests."""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping
+
+
+@dataclass(frozen=True, slots=True)
+class StubResponse:
+    """Minimal stand-in for httpx.Response carrying a JSON payload."""
+
+    data: Any
+
+    def json(self) -> Any:
+        """Return the canned payload."""
+        return self.data
+
+    def raise_for_status(self) -> None:
+        """Stub responses never carry an error status."""
+
+
+def _by_endpoint(endpoint: str, params: dict) -> str:
+    """Key responses by request endpoint."""
+    return endpoint
+
+
+class StubHTTPClient:
+    """Stand-in for httpx.AsyncClient that serves canned JSON payloads.
+
+    Responses are looked up by ``key(endpoint, params)``. A response that is
+    an exception instance is raised instead of returned.
+    """
+
+    def __init__(
+        self,
+        responses: Mapping[str, Any],
+        key: Callable[[str, dict], str] = _by_endpoint,
+        default: Any = None,
+    ) -> None:
+        self.responses = responses
+        self.key = key
+        self.default = default
+        self.calls: list[tuple[str, dict]] = []
+
+    async def get(self, endpoint: str, params: dict) -> StubResponse:
+        """Record the request and return the canned response."""
+        self.calls.append((endpoint, params))
+        data = self.responses.get(self.key(endpoint, params), self.default)
+        if isinstance(data, Exception):
+            raise data
+        return StubResponse(data)
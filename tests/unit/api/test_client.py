@@ -4,7 +4,6 @@ import pytest
 import respx
 from httpx import Response
 
-from boomberg.api.client import FMPClient
 from boomberg.api.exceptions import APIError, RateLimitError, SymbolNotFoundError
 from boomberg.api.models import (
     CompanyProfile,
@@ -14,25 +13,42 @@ from boomberg.api.models import (
     SearchResult,
 )
 
+# FMP routes are registered once; each test sets responses on the routes it uses
+_fmp_mock = respx.mock(base_url="https://financialmodelingprep.com/stable", assert_all_called=False)
+_fmp_mock.get("/quote", name="quote")
+_fmp_mock.get("/historical-price-eod/full", name="historical")
+_fmp_mock.get("/profile", name="profile")
+_fmp_mock.get("/news/stock", name="news")
+_fmp_mock.get("/news/stock-latest", name="news_latest")
+_fmp_mock.get("/search-name", name="search")
 
+
+@pytest.mark.xdist_group(name="api_fmp")
 class TestFMPClient:
     """Tests for FMPClient."""
 
     @pytest.fixture
-    def client(self, test_settings):
-        """Create FMP client with test settings."""
-        return FMPClient(settings=test_settings)
+    def client(self, fmp_client):
+        """Shared FMP client with test settings."""
+        return fmp_client
+
+    @pytest.fixture
+    def entered_client(self, entered_fmp_client):
+        """Shared FMP client with an open HTTP session."""
+        return entered_fmp_client
+
+    @pytest.fixture(autouse=True)
+    def api_mock(self):
+        """Activate the FMP routes; responses set in a test are rolled back after it."""
+        with _fmp_mock:
+            yield _fmp_mock
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_get_quote_success(self, client, sample_quote_data):
+    async def test_get_quote_success(self, entered_client, api_mock, sample_quote_data):
         """Test successful quote retrieval."""
-        respx.get(
-            "https://financialmodelingprep.com/stable/quote"
-        ).mock(return_value=Response(200, json=[sample_quote_data]))
+        api_mock["quote"].mock(return_value=Response(200, json=[sample_quote_data]))
 
-        async with client:
-            quote = await client.get_quote("AAPL")
+        quote = await entered_client.get_quote("AAPL")
 
         assert isinstance(quote, Quote)
         assert quote.symbol == "AAPL"
@@ -40,190 +56,124 @@ class TestFMPClient:
         assert quote.change == 2.35
         assert quote.change_percent == 1.28
 
-    @respx.mock
+    @pytest.mark.parametrize(
+        "route, method",
+        [
+            ("quote", "get_quote"),
+            ("profile", "get_company_profile"),
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_get_quote_symbol_not_found(self, client):
-        """Test quote retrieval for unknown symbol."""
-        respx.get(
-            "https://financialmodelingprep.com/stable/quote"
-        ).mock(return_value=Response(200, json=[]))
+    async def test_symbol_not_found(self, entered_client, api_mock, route, method):
+        """Test single-symbol lookups raise for an empty response."""
+        api_mock[route].mock(return_value=Response(200, json=[]))
 
-        async with client:
-            with pytest.raises(SymbolNotFoundError) as exc_info:
-                await client.get_quote("INVALID")
+        with pytest.raises(SymbolNotFoundError) as exc_info:
+            await getattr(entered_client, method)("INVALID")
 
         assert exc_info.value.symbol == "INVALID"
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_get_quote_rate_limit(self, client):
+    async def test_get_quote_rate_limit(self, entered_client, api_mock):
         """Test rate limit handling."""
-        respx.get(
-            "https://financialmodelingprep.com/stable/quote"
-        ).mock(return_value=Response(429, json={"error": "Rate limit exceeded"}))
+        api_mock["quote"].mock(return_value=Response(429, json={"error": "Rate limit exceeded"}))
 
-        async with client:
-            with pytest.raises(RateLimitError):
-                await client.get_quote("AAPL")
+        with pytest.raises(RateLimitError):
+            await entered_client.get_quote("AAPL")
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_get_quotes_multiple(self, client, sample_quote_data):
+    async def test_get_quotes_multiple(self, entered_client, api_mock, sample_quote_data):
         """Test batch quote retrieval."""
         msft_data = {**sample_quote_data, "symbol": "MSFT", "price": 405.00}
-        # Mock individual quote endpoints since stable API doesn't support batch
-        respx.get(
-            "https://financialmodelingprep.com/stable/quote",
-            params__contains={"symbol": "AAPL"}
-        ).mock(return_value=Response(200, json=[sample_quote_data]))
-        respx.get(
-            "https://financialmodelingprep.com/stable/quote",
-            params__contains={"symbol": "MSFT"}
-        ).mock(return_value=Response(200, json=[msft_data]))
-
-        async with client:
-            quotes = await client.get_quotes(["AAPL", "MSFT"])
+        quotes_by_symbol = {"AAPL": [sample_quote_data], "MSFT": [msft_data]}
+        # Answer individual quote requests since stable API doesn't support batch
+        api_mock["quote"].mock(
+            side_effect=lambda request: Response(
+                200, json=quotes_by_symbol[request.url.params["symbol"]]
+            )
+        )
+
+        quotes = await entered_client.get_quotes(["AAPL", "MSFT"])
 
         assert len(quotes) == 2
         symbols = {q.symbol for q in quotes}
         assert symbols == {"AAPL", "MSFT"}
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_get_quotes_empty_list(self, client):
+    async def test_get_quotes_empty_list(self, entered_client):
         """Test batch quote with empty list."""
-        async with client:
-            quotes = await client.get_quotes([])
+        quotes = await entered_client.get_quotes([])
 
         assert quotes == []
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_get_historical_prices(self, client, sample_historical_data):
+    async def test_get_historical_prices(self, entered_client, api_mock, sample_historical_data):
         """Test historical price retrieval."""
-        respx.get(
-            "https://financialmodelingprep.com/stable/historical-price-eod/full"
-        ).mock(return_value=Response(200, json=sample_historical_data))
+        api_mock["historical"].mock(return_value=Response(200, json=sample_historical_data))
 
-        async with client:
-            prices = await client.get_historical_prices("AAPL")
+        prices = await entered_client.get_historical_prices("AAPL")
 
         assert len(prices) == 2
         assert all(isinstance(p, HistoricalPrice) for p in prices)
         assert prices[0].close == 184.50
 
-    @respx.mock
-    @pytest.mark.asyncio
-    async def test_get_historical_prices_empty(self, client):
-        """Test historical price retrieval with no data."""
-        respx.get(
-            "https://financialmodelingprep.com/stable/historical-price-eod/full"
-        ).mock(return_value=Response(200, json=[]))
-
-        async with client:
-            prices = await client.get_historical_prices("INVALID")
-
-        assert prices == []
-
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_get_company_profile(self, client, sample_profile_data):
+    async def test_get_company_profile(self, entered_client, api_mock, sample_profile_data):
         """Test company profile retrieval."""
-        respx.get(
-            "https://financialmodelingprep.com/stable/profile"
-        ).mock(return_value=Response(200, json=[sample_profile_data]))
+        api_mock["profile"].mock(return_value=Response(200, json=[sample_profile_data]))
 
-        async with client:
-            profile = await client.get_company_profile("AAPL")
+        profile = await entered_client.get_company_profile("AAPL")
 
         assert isinstance(profile, CompanyProfile)
         assert profile.symbol == "AAPL"
         assert profile.company_name == "Apple Inc."
         assert profile.sector == "Technology"
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_get_company_profile_not_found(self, client):
-        """Test company profile for unknown symbol."""
-        respx.get(
-            "https://financialmodelingprep.com/stable/profile"
-        ).mock(return_value=Response(200, json=[]))
-
-        async with client:
-            with pytest.raises(SymbolNotFoundError):
-                await client.get_company_profile("INVALID")
-
-    @respx.mock
-    @pytest.mark.asyncio
-    async def test_get_news(self, client, sample_news_data):
+    async def test_get_news(self, entered_client, api_mock, sample_news_data):
         """Test news retrieval."""
-        respx.get(
-            "https://financialmodelingprep.com/stable/news/stock"
-        ).mock(return_value=Response(200, json=sample_news_data))
+        api_mock["news"].mock(return_value=Response(200, json=sample_news_data))
 
-        async with client:
-            news = await client.get_news(symbol="AAPL", limit=10)
+        news = await entered_client.get_news(symbol="AAPL", limit=10)
 
         assert len(news) == 1
         assert isinstance(news[0], NewsArticle)
         assert news[0].title == "Apple Reports Record Q4 Earnings"
 
-    @respx.mock
-    @pytest.mark.asyncio
-    async def test_get_news_empty(self, client):
-        """Test news retrieval with no results."""
-        respx.get(
-            "https://financialmodelingprep.com/stable/news/stock-latest"
-        ).mock(return_value=Response(200, json=[]))
-
-        async with client:
-            news = await client.get_news()
-
-        assert news == []
-
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_search(self, client, sample_search_data):
+    async def test_search(self, entered_client, api_mock, sample_search_data):
         """Test symbol search."""
-        respx.get(
-            "https://financialmodelingprep.com/stable/search-name"
-        ).mock(return_value=Response(200, json=sample_search_data))
+        api_mock["search"].mock(return_value=Response(200, json=sample_search_data))
 
-        async with client:
-            results = await client.search("apple", limit=10)
+        results = await entered_client.search("apple", limit=10)
 
         assert len(results) == 2
         assert all(isinstance(r, SearchResult) for r in results)
         assert results[0].symbol == "AAPL"
 
-    @respx.mock
+    @pytest.mark.parametrize(
+        "route, method, args",
+        [
+            ("historical", "get_historical_prices", ("INVALID",)),
+            ("news_latest", "get_news", ()),
+            ("search", "search", ("xyznonexistent",)),
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_search_empty(self, client):
-        """Test symbol search with no results."""
-        respx.get(
-            "https://financialmodelingprep.com/stable/search-name"
-        ).mock(return_value=Response(200, json=[]))
+    async def test_empty_response_returns_empty_list(self, entered_client, api_mock, route, method, args):
+        """Test list endpoints return an empty list for an empty response."""
+        api_mock[route].mock(return_value=Response(200, json=[]))
 
-        async with client:
-            results = await client.search("xyznonexistent")
+        result = await getattr(entered_client, method)(*args)
 
-        assert results == []
+        assert result == []
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_api_error_handling(self, client):
+    async def test_api_error_handling(self, entered_client, api_mock):
         """Test general API error handling."""
-        respx.get(
-            "https://financialmodelingprep.com/stable/quote"
-        ).mock(return_value=Response(500, text="Internal Server Error"))
+        api_mock["quote"].mock(return_value=Response(500, text="Internal Server Error"))
 
-        async with client:
-            with pytest.raises(APIError) as exc_info:
-                await client.get_quote("AAPL")
+        with pytest.raises(APIError) as exc_info:
+            await entered_client.get_quote("AAPL")
 
         assert exc_info.value.status_code == 500
-
-    def test_client_not_initialized(self, client):
-        """Test error when client used without context manager."""
-        with pytest.raises(RuntimeError, match="Client not initialized"):
-            _ = client.client
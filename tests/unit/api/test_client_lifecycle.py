@@ -0,0 +1,18 @@
+"""Unit tests for lifecycle behavior shared by all API clients."""
+
+import pytest
+
+
+class TestClientLifecycle:
+    """Tests for behavior common to FMP, EODHD, FRED and Kalshi clients."""
+
+    @pytest.mark.parametrize(
+        "client_fixture",
+        ["fmp_client", "eodhd_client", "fred_client", "kalshi_client"],
+    )
+    def test_client_not_initialized(self, request, client_fixture):
+        """Test accessing the HTTP client outside the context manager raises."""
+        client = request.getfixturevalue(client_fixture)
+
+        with pytest.raises(RuntimeError, match="Client not initialized"):
+            _ = client.client
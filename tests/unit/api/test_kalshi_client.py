@@ -1,176 +1,133 @@
 """Unit tests for Kalshi API client."""
 
+import re
+
 import pytest
 import respx
 from httpx import Response
 
-from boomberg.api.kalshi_client import KalshiClient
 from boomberg.api.kalshi_models import KalshiMarket
 from boomberg.api.exceptions import APIError
 
+_KALSHI_API = "https://api.elections.kalshi.com/trade-api/v2"
 
-@pytest.fixture
-def sample_kalshi_market_data() -> dict:
-    """Sample Kalshi market API response data."""
-    return {
-        "ticker": "FED-25MAR-T4.75",
-        "title": "Will the Fed cut rates in March 2025?",
-        "yes_bid": 62,
-        "no_bid": 36,
-        "yes_ask": 64,
-        "no_ask": 38,
-        "last_price": 63,
-        "previous_price": 60,
-        "volume_24h": 125400,
-        "open_interest": 450200,
-        "status": "active",
-        "close_time": "2025-03-15T16:00:00Z",
-    }
-
-
-@pytest.fixture
-def sample_kalshi_markets_response(sample_kalshi_market_data) -> dict:
-    """Sample Kalshi markets list API response."""
-    return {
-        "markets": [
-            sample_kalshi_market_data,
-            {
-                "ticker": "BTC-100K-EOY",
-                "title": "Will BTC hit $100K by EOY?",
-                "yes_bid": 45,
-                "no_bid": 53,
-                "yes_ask": 47,
-                "no_ask": 55,
-                "last_price": 45,
-                "previous_price": 47,
-                "volume_24h": 89200,
-                "open_interest": 320000,
-                "status": "active",
-                "close_time": "2025-12-31T23:59:59Z",
-            },
-        ],
-        "cursor": None,
-    }
+# Kalshi routes are registered once; each test sets responses on the routes it uses
+_kalshi_mock = respx.mock(assert_all_called=False)
+_kalshi_mock.get(f"{_KALSHI_API}/events", name="events")
+_kalshi_mock.get(f"{_KALSHI_API}/markets", name="markets")
+_kalshi_mock.get(url__regex=rf"{re.escape(_KALSHI_API)}/markets/[^/?]+$", name="market")
 
 
-@pytest.fixture
-def sample_events_response() -> dict:
-    """Sample events list API response."""
-    return {
-        "events": [
-            {"event_ticker": "KXFED-25MAR", "title": "Fed March 2025"},
-            {"event_ticker": "KXBTC-100K", "title": "BTC 100K"},
-        ]
-    }
+def _respond_by_param(param: str, payloads: dict):
+    """Build a route side effect that answers with the payload for a query param."""
+    return lambda request: Response(200, json=payloads[request.url.params[param]])
 
 
+@pytest.mark.xdist_group(name="api_kalshi")
 class TestKalshiClient:
     """Tests for KalshiClient."""
 
     @pytest.fixture
-    def client(self):
-        """Create Kalshi client."""
-        return KalshiClient()
+    def client(self, kalshi_client):
+        """Shared Kalshi client."""
+        return kalshi_client
+
+    @pytest.fixture
+    def entered_client(self, entered_kalshi_client):
+        """Shared Kalshi client with an open HTTP session."""
+        return entered_kalshi_client
+
+    @pytest.fixture(autouse=True)
+    def api_mock(self):
+        """Activate the Kalshi routes; responses set in a test are rolled back after it."""
+        with _kalshi_mock:
+            yield _kalshi_mock
 
-    @respx.mock
     @pytest.mark.asyncio
     async def test_get_markets_success(
-        self, client, sample_events_response, sample_kalshi_markets_response
+        self, entered_client, api_mock, sample_events_response, sample_kalshi_markets_response
     ):
         """Test successful markets retrieval via events."""
         # Mock events endpoint
-        respx.get(
-            "https://api.elections.kalshi.com/trade-api/v2/events"
-        ).mock(return_value=Response(200, json=sample_events_response))
+        api_mock["events"].mock(return_value=Response(200, json=sample_events_response))
 
         # Mock markets endpoint for each event
-        respx.get(
-            "https://api.elections.kalshi.com/trade-api/v2/markets",
-            params__contains={"event_ticker": "KXFED-25MAR"},
-        ).mock(return_value=Response(200, json=sample_kalshi_markets_response))
-
-        respx.get(
-            "https://api.elections.kalshi.com/trade-api/v2/markets",
-            params__contains={"event_ticker": "KXBTC-100K"},
-        ).mock(return_value=Response(200, json={"markets": []}))
-
-        async with client:
-            markets = await client.get_markets(limit=10)
+        api_mock["markets"].mock(
+            side_effect=_respond_by_param(
+                "event_ticker",
+                {
+                    "KXFED-25MAR": sample_kalshi_markets_response,
+                    "KXBTC-100K": {"markets": []},
+                },
+            )
+        )
+
+        markets = await entered_client.get_markets(limit=10)
 
         assert len(markets) == 2
         assert all(isinstance(m, KalshiMarket) for m in markets)
         assert markets[0].ticker == "FED-25MAR-T4.75"
         assert markets[1].ticker == "BTC-100K-EOY"
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_get_markets_for_event(self, client, sample_kalshi_markets_response):
+    async def test_get_markets_for_event(self, entered_client, api_mock, sample_kalshi_markets_response):
         """Test fetching markets for a specific event."""
-        respx.get(
-            "https://api.elections.kalshi.com/trade-api/v2/markets",
-            params__contains={"event_ticker": "KXFED-25MAR"},
-        ).mock(return_value=Response(200, json=sample_kalshi_markets_response))
+        api_mock["markets"].mock(
+            side_effect=_respond_by_param("event_ticker", {"KXFED-25MAR": sample_kalshi_markets_response})
+        )
 
-        async with client:
-            markets = await client.get_markets_for_event("KXFED-25MAR")
+        markets = await entered_client.get_markets_for_event("KXFED-25MAR")
 
         assert len(markets) == 2
         assert all(isinstance(m, KalshiMarket) for m in markets)
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_get_events(self, client, sample_events_response):
+    async def test_get_events(self, entered_client, api_mock, sample_events_response):
         """Test fetching events."""
-        respx.get(
-            "https://api.elections.kalshi.com/trade-api/v2/events"
-        ).mock(return_value=Response(200, json=sample_events_response))
+        api_mock["events"].mock(return_value=Response(200, json=sample_events_response))
 
-        async with client:
-            events = await client.get_events(limit=10)
+        events = await entered_client.get_events(limit=10)
 
         assert len(events) == 2
         assert events[0]["event_ticker"] == "KXFED-25MAR"
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_get_market_by_ticker_success(self, client, sample_kalshi_market_data):
+    async def test_get_market_by_ticker_success(self, entered_client, api_mock, sample_kalshi_market_data):
         """Test successful single market retrieval."""
-        respx.get(
-            "https://api.elections.kalshi.com/trade-api/v2/markets/FED-25MAR-T4.75"
-        ).mock(return_value=Response(200, json={"market": sample_kalshi_market_data}))
+        api_mock["market"].mock(return_value=Response(200, json={"market": sample_kalshi_market_data}))
 
-        async with client:
-            market = await client.get_market("FED-25MAR-T4.75")
+        market = await entered_client.get_market("FED-25MAR-T4.75")
 
         assert isinstance(market, KalshiMarket)
         assert market.ticker == "FED-25MAR-T4.75"
         assert market.title == "Will the Fed cut rates in March 2025?"
         assert market.yes_bid == 62
 
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_get_market_not_found(self, client):
+    async def test_get_market_not_found(self, entered_client, api_mock):
         """Test market retrieval for unknown ticker."""
-        respx.get(
-            "https://api.elections.kalshi.com/trade-api/v2/markets/INVALID"
-        ).mock(return_value=Response(404, json={"error": "Market not found"}))
+        api_mock["market"].mock(return_value=Response(404, json={"error": "Market not found"}))
 
-        async with client:
-            with pytest.raises(APIError) as exc_info:
-                await client.get_market("INVALID")
+        with pytest.raises(APIError) as exc_info:
+            await entered_client.get_market("INVALID")
 
         assert exc_info.value.status_code == 404
 
-    @respx.mock
+    @pytest.mark.parametrize(
+        "route, payload, method, args",
+        [
+            ("events", {"events": []}, "get_markets", ()),
+            ("markets", {"markets": []}, "get_markets_by_series", ("KXEMPTY",)),
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_get_markets_empty_events(self, client):
-        """Test empty events response."""
-        respx.get(
-            "https://api.elections.kalshi.com/trade-api/v2/events"
-        ).mock(return_value=Response(200, json={"events": []}))
+    async def test_empty_response_returns_no_markets(
+        self, entered_client, api_mock, route, payload, method, args
+    ):
+        """Test market lookups return an empty list for empty responses."""
+        api_mock[route].mock(return_value=Response(200, json=payload))
 
-        async with client:
-            markets = await client.get_markets()
+        markets = await getattr(entered_client, method)(*args)
 
         assert markets == []
 
@@ -184,36 +141,14 @@ class TestKalshiClient:
 
         assert client._client is None
 
-    def test_client_not_initialized_error(self, client):
-        """Test error when accessing client before initialization."""
-        with pytest.raises(RuntimeError, match="Client not initialized"):
-            _ = client.client
-
-    @respx.mock
     @pytest.mark.asyncio
-    async def test_get_markets_by_series(self, client, sample_kalshi_markets_response):
+    async def test_get_markets_by_series(self, entered_client, api_mock, sample_kalshi_markets_response):
         """Test fetching markets for a specific series."""
-        respx.get(
-            "https://api.elections.kalshi.com/trade-api/v2/markets",
-            params__contains={"series_ticker": "KXFED"},
-        ).mock(return_value=Response(200, json=sample_kalshi_markets_response))
+        api_mock["markets"].mock(
+            side_effect=_respond_by_param("series_ticker", {"KXFED": sample_kalshi_markets_response})
+        )
 
-        async with client:
-            markets = await client.get_markets_by_series("KXFED")
+        markets = await entered_client.get_markets_by_series("KXFED")
 
         assert len(markets) == 2
         assert all(isinstance(m, KalshiMarket) for m in markets)
-
-    @respx.mock
-    @pytest.mark.asyncio
-    async def test_get_markets_by_series_empty(self, client):
-        """Test fetching markets for a series with no markets."""
-        respx.get(
-            "https://api.elections.kalshi.com/trade-api/v2/markets",
-            params__contains={"series_ticker": "KXEMPTY"},
-        ).mock(return_value=Response(200, json={"markets": []}))
-
-        async with client:
-            markets = await client.get_markets_by_series("KXEMPTY")
-
-        assert markets == []
@@ -5,6 +5,13 @@ import pytest
 from boomberg.api.kalshi_models import KalshiMarket
 
 
+def _make_market(**fields) -> KalshiMarket:
+    """Build a market from trusted test values without running validation."""
+    return KalshiMarket.model_construct(
+        **{"ticker": "TEST", "title": "Test Market", "status": "active", **fields}
+    )
+
+
 class TestKalshiMarket:
     """Tests for KalshiMarket model."""
 
@@ -54,91 +61,47 @@ class TestKalshiMarket:
 
     def test_market_yes_price_dollars(self):
         """Test that yes_price_dollars returns cents as dollars."""
-        market = KalshiMarket(
-            ticker="TEST",
-            title="Test Market",
-            status="active",
-            yes_bid=62,
-        )
+        market = _make_market(yes_bid=62)
         assert market.yes_price_dollars == 0.62
 
     def test_market_no_price_dollars(self):
         """Test that no_price_dollars returns cents as dollars."""
-        market = KalshiMarket(
-            ticker="TEST",
-            title="Test Market",
-            status="active",
-            no_bid=38,
-        )
+        market = _make_market(no_bid=38)
         assert market.no_price_dollars == 0.38
 
     def test_market_last_price_dollars(self):
         """Test that last_price_dollars returns cents as dollars."""
-        market = KalshiMarket(
-            ticker="TEST",
-            title="Test Market",
-            status="active",
-            last_price=63,
-        )
+        market = _make_market(last_price=63)
         assert market.last_price_dollars == 0.63
 
     def test_market_change_cents(self):
         """Test calculating price change in cents."""
-        market = KalshiMarket(
-            ticker="TEST",
-            title="Test Market",
-            status="active",
-            last_price=63,
-            previous_price=60,
-        )
+        market = _make_market(last_price=63, previous_price=60)
         assert market.change_cents == 3
 
     def test_market_change_cents_negative(self):
         """Test calculating negative price change."""
-        market = KalshiMarket(
-            ticker="TEST",
-            title="Test Market",
-            status="active",
-            last_price=55,
-            previous_price=60,
-        )
+        market = _make_market(last_price=55, previous_price=60)
         assert market.change_cents == -5
 
     def test_market_change_cents_with_missing_prices(self):
         """Test change is 0 when prices are missing."""
-        market = KalshiMarket(
-            ticker="TEST",
-            title="Test Market",
-            status="active",
-        )
+        market = _make_market()
         assert market.change_cents == 0
 
     def test_market_price_dollars_none_when_bid_missing(self):
         """Test price returns None when bid is missing."""
-        market = KalshiMarket(
-            ticker="TEST",
-            title="Test Market",
-            status="active",
-        )
+        market = _make_market()
         assert market.yes_price_dollars is None
         assert market.no_price_dollars is None
         assert market.last_price_dollars is None
 
     def test_market_with_series_ticker(self):
         """Test market can store series_ticker."""
-        market = KalshiMarket(
-            ticker="FED-25MAR",
-            title="Test",
-            status="active",
-            series_ticker="KXFED",
-        )
+        market = _make_market(ticker="FED-25MAR", title="Test", series_ticker="KXFED")
         assert market.series_ticker == "KXFED"
 
     def test_market_series_ticker_defaults_to_none(self):
         """Test series_ticker defaults to None."""
-        market = KalshiMarket(
-            ticker="TEST",
-            title="Test",
-            status="active",
-        )
+        market = _make_market(title="Test")
         assert market.series_ticker is None
@@ -6,6 +6,8 @@ import pytest
 
 from boomberg.api.models import HistoricalPrice, Quote
 
+_TEST_DATE = date(2024, 1, 15)
+
 
 class TestQuote:
     """Tests for Quote model."""
@@ -38,7 +40,7 @@ class TestHistoricalPrice:
     def test_historical_price_accepts_float_volume(self):
         """Test that HistoricalPrice model accepts float values for volume."""
         price = HistoricalPrice(
-            date=date(2024, 1, 15),
+            date=_TEST_DATE,
             open=175.0,
             high=176.0,
             low=174.0,
@@ -50,7 +52,7 @@ class TestHistoricalPrice:
     def test_historical_price_accepts_int_volume(self):
         """Test that HistoricalPrice model still accepts int values for volume."""
         price = HistoricalPrice(
-            date=date(2024, 1, 15),
+            date=_TEST_DATE,
             open=175.0,
             high=176.0,
             low=174.0,
@@ -0,0 +1,51 @@
+"""Shared fixtures for service tests."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from boomberg.api.client import FMPClient
+from boomberg.api.eodhd_client import EODHDClient
+from boomberg.api.fred_client import FREDClient
+
+
+def _reset(client: Mock) -> Mock:
+    """Clear calls and canned results left on a shared mock by earlier tests."""
+    client.reset_mock(return_value=True, side_effect=True)
+    return client
+
+
+@pytest.fixture(scope="session")
+def session_mock_fmp_client() -> Mock:
+    """Create a mock FMP client shared across service tests."""
+    return Mock(spec=FMPClient)
+
+
+@pytest.fixture(scope="session")
+def session_mock_fred_client() -> Mock:
+    """Create a mock FRED client shared across service tests."""
+    return Mock(spec=FREDClient)
+
+
+@pytest.fixture(scope="session")
+def session_mock_eodhd_client() -> Mock:
+    """Create a mock EODHD client shared across service tests."""
+    return Mock(spec=EODHDClient)
+
+
+@pytest.fixture
+def mock_fmp_client(session_mock_fmp_client) -> Mock:
+    """Shared mock FMP client, reset for the current test."""
+    return _reset(session_mock_fmp_client)
+
+
+@pytest.fixture
+def mock_fred_client(session_mock_fred_client) -> Mock:
+    """Shared mock FRED client, reset for the current test."""
+    return _reset(session_mock_fred_client)
+
+
+@pytest.fixture
+def mock_eodhd_client(session_mock_eodhd_client) -> Mock:
+    """Shared mock EODHD client, reset for the current test."""
+    return _reset(session_mock_eodhd_client)
@@ -1,36 +1,93 @@
 """Unit tests for DashboardService."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from rich.table import Table
 
 from boomberg.api.models import Quote, NewsArticle
 from boomberg.services.dashboard import DashboardService
 
 
-class TestDashboardService:
-    """Tests for DashboardService."""
-
-    @pytest.fixture
-    def mock_fmp_client(self):
-        """Create a mock FMP client."""
-        return MagicMock()
+# (symbol, name, price, change, change %) rows for the sample quote fixtures
+_WORLD_INDEX_ROWS = (
+    ("^GSPC", "S&P 500", 5234.18, 23.45, 0.45),
+    ("^DJI", "Dow Jones", 38654.42, 123.45, 0.32),
+    ("^IXIC", "NASDAQ", 16428.82, 109.88, 0.67),
+    ("^RUT", "Russell 2000", 2045.32, -3.07, -0.15),
+    ("^FTSE", "FTSE 100", 8125.45, 26.00, 0.32),
+    ("^GDAXI", "DAX", 18432.67, 106.91, 0.58),
+    ("^N225", "Nikkei 225", 38452.12, 473.16, 1.23),
+    ("^HSI", "Hang Seng", 17845.32, -80.30, -0.45),
+)
+
+_COMMODITY_ROWS = (
+    ("GLD", "SPDR Gold Shares", 185.45, 0.83, 0.45),
+    ("USO", "United States Oil Fund", 72.30, -0.89, -1.23),
+    ("SLV", "iShares Silver Trust", 22.15, 0.07, 0.32),
+    ("UNG", "United States Natural Gas Fund", 12.45, -0.27, -2.15),
+    ("DBA", "Invesco DB Agriculture Fund", 24.80, 0.04, 0.18),
+    ("URA", "Global X Uranium ETF", 28.50, 0.42, 1.50),
+)
+
+_SECTOR_ROWS = (
+    ("XLK", "Technology Select Sector", 195.42, 2.31, 1.2),
+    ("XLF", "Financial Select Sector", 42.15, 0.34, 0.8),
+    ("XLE", "Energy Select Sector", 87.30, -0.44, -0.5),
+    ("XLV", "Health Care Select Sector", 145.67, 0.44, 0.3),
+    ("XLY", "Consumer Discretionary Select", 182.45, 1.09, 0.6),
+    ("XLI", "Industrial Select Sector", 120.34, 0.96, 0.8),
+)
+
+_SNAPSHOT_INDEX_ROWS = (
+    ("^GSPC", "S&P 500", 5234.18, 23.45, 0.45),
+    ("^DJI", "Dow Jones", 38654.42, 123.45, 0.32),
+    ("^IXIC", "NASDAQ", 16428.82, 109.88, 0.67),
+    ("^RUT", "Russell 2000", 2045.32, -3.07, -0.15),
+    ("^FTSE", "FTSE 100", 8125.45, 26.00, 0.32),
+    ("^GDAXI", "DAX", 18432.67, 106.91, 0.58),
+    ("^FCHI", "CAC 40", 7890.12, 19.73, 0.25),
+    ("^N225", "Nikkei 225", 38452.12, 473.16, 1.23),
+    ("^HSI", "Hang Seng", 17845.32, -80.30, -0.45),
+    ("^KS11", "KOSPI", 2654.78, 21.77, 0.82),
+)
+
+
+def _quotes(rows) -> list[Quote]:
+    """Build sample quotes from trusted rows without running validation."""
+    return [
+        Quote.model_construct(symbol=symbol, name=name, price=price, change=change, change_percent=change_percent)
+        for symbol, name, price, change, change_percent in rows
+    ]
+
+
+def _table_text(table: Table) -> str:
+    """Collect a table's header and cell text without rendering it."""
+    return "\n".join(
+        str(text) for column in table.columns for text in (column.header, *column.cells)
+    )
+
+
+@pytest.fixture
+def service(mock_fmp_client):
+    """Create DashboardService with mock FMP client only."""
+    return DashboardService(mock_fmp_client)
+
+
+@pytest.fixture
+def service_with_fred(mock_fmp_client, mock_fred_client):
+    """Create DashboardService with both FMP and FRED clients."""
+    return DashboardService(mock_fmp_client, mock_fred_client)
+
+
+@pytest.fixture
+def service_with_eodhd(mock_fmp_client, mock_eodhd_client):
+    """Create DashboardService with both FMP and EODHD clients."""
+    return DashboardService(mock_fmp_client, eodhd_client=mock_eodhd_client)
 
-    @pytest.fixture
-    def mock_fred_client(self):
-        """Create a mock FRED client."""
-        return MagicMock()
 
-    @pytest.fixture
-    def service(self, mock_fmp_client):
-        """Create DashboardService with mock client (no FRED)."""
-        return DashboardService(mock_fmp_client)
-
-    @pytest.fixture
-    def service_with_fred(self, mock_fmp_client, mock_fred_client):
-        """Create DashboardService with both FMP and FRED clients."""
-        return DashboardService(mock_fmp_client, mock_fred_client)
+class TestDashboardService:
+    """Tests for DashboardService."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_quote(self) -> Quote:
         """Create a sample quote for testing."""
         return Quote(
@@ -42,41 +99,29 @@ class TestDashboardService:
             volume=2500000000,
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_quotes(self) -> list[Quote]:
         """Create sample quotes for world indices."""
-        return [
-            Quote(symbol="^GSPC", name="S&P 500", price=5234.18, change=23.45, changePercentage=0.45),
-            Quote(symbol="^DJI", name="Dow Jones", price=38654.42, change=123.45, changePercentage=0.32),
-            Quote(symbol="^IXIC", name="NASDAQ", price=16428.82, change=109.88, changePercentage=0.67),
-            Quote(symbol="^RUT", name="Russell 2000", price=2045.32, change=-3.07, changePercentage=-0.15),
-            Quote(symbol="^FTSE", name="FTSE 100", price=8125.45, change=26.00, changePercentage=0.32),
-            Quote(symbol="^GDAXI", name="DAX", price=18432.67, change=106.91, changePercentage=0.58),
-            Quote(symbol="^N225", name="Nikkei 225", price=38452.12, change=473.16, changePercentage=1.23),
-            Quote(symbol="^HSI", name="Hang Seng", price=17845.32, change=-80.30, changePercentage=-0.45),
-        ]
+        return _quotes(_WORLD_INDEX_ROWS)
 
-    @pytest.mark.asyncio
     async def test_get_world_indices(self, service, mock_fmp_client, sample_quotes):
         """Test fetching world indices."""
-        mock_fmp_client.get_world_indices = AsyncMock(return_value=sample_quotes)
+        mock_fmp_client.get_world_indices.return_value = sample_quotes
 
         result = await service.get_world_indices()
 
         assert len(result) == 8
         mock_fmp_client.get_world_indices.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_get_most_active(self, service, mock_fmp_client, sample_quote):
         """Test fetching most active stocks."""
-        mock_fmp_client.get_most_active = AsyncMock(return_value=[sample_quote])
+        mock_fmp_client.get_most_active.return_value = [sample_quote]
 
         result = await service.get_most_active(limit=20)
 
         assert len(result) == 1
         mock_fmp_client.get_most_active.assert_called_once_with(20)
 
-    @pytest.mark.asyncio
     async def test_get_treasury_rates(self, service, mock_fmp_client):
         """Test fetching treasury rates."""
         mock_rates = {
@@ -86,42 +131,39 @@ class TestDashboardService:
             "year10": 4.28,
             "year30": 4.45,
         }
-        mock_fmp_client.get_treasury_rates = AsyncMock(return_value=mock_rates)
+        mock_fmp_client.get_treasury_rates.return_value = mock_rates
 
         result = await service.get_treasury_rates()
 
         assert result["month1"] == 5.25
         mock_fmp_client.get_treasury_rates.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_get_forex_rates(self, service, mock_fmp_client):
         """Test fetching forex rates."""
         mock_rates = [
             {"ticker": "EURUSD", "bid": 1.0843, "ask": 1.0847, "changes": 0.12},
             {"ticker": "GBPUSD", "bid": 1.2652, "ask": 1.2656, "changes": -0.08},
         ]
-        mock_fmp_client.get_forex_quotes = AsyncMock(return_value=mock_rates)
+        mock_fmp_client.get_forex_quotes.return_value = mock_rates
 
         result = await service.get_forex_rates()
 
         assert len(result) == 2
         mock_fmp_client.get_forex_quotes.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_get_economic_stats_without_fred(self, service):
         """Test economic stats returns empty dict when FRED not configured."""
         result = await service.get_economic_stats()
 
         assert result == {}
 
-    @pytest.mark.asyncio
     async def test_get_economic_stats_with_fred(self, service_with_fred, mock_fred_client):
         """Test economic stats returns data when FRED is configured."""
         mock_stats = {
             "GDP": {"date": "2024-10-01", "value": "27963.5"},
             "Unemployment": {"date": "2025-01-01", "value": "3.7"},
         }
-        mock_fred_client.get_economic_indicators = AsyncMock(return_value=mock_stats)
+        mock_fred_client.get_economic_indicators.return_value = mock_stats
 
         result = await service_with_fred.get_economic_stats()
 
@@ -135,24 +177,13 @@ class TestDashboardService:
 
     def test_format_indices(self, service, sample_quotes):
         """Test formatting world indices."""
-        from rich.console import Console
-        from io import StringIO
-
         result = service.format_indices(sample_quotes)
 
-        # Render the table to a string for testing
-        console = Console(file=StringIO(), force_terminal=True, width=120)
-        console.print(result)
-        output = console.file.getvalue()
+        output = _table_text(result)
 
-        # Check headers are present
-        assert "US Equities" in output
-        assert "EU Equities" in output
-        assert "Asia Equities" in output
-        # Check index name is present
-        assert "S&P 500" in output
-        # Check change percentage is present
-        assert "0.45%" in output
+        expected = ("US Equities", "EU Equities", "Asia Equities", "S&P 500", "0.45%")
+        missing = [token for token in expected if token not in output]
+        assert not missing, f"missing tokens: {missing}"
 
     def test_format_most_active_empty(self, service):
         """Test formatting empty most active list."""
@@ -201,19 +232,13 @@ class TestDashboardService:
 
     def test_format_forex(self, service):
         """Test formatting currency ETFs."""
-        from rich.console import Console
-        from io import StringIO
-
         quotes = [
             Quote(symbol="FXE", name="Euro Currency Trust", price=109.58, change=0.07, changePercentage=0.06),
             Quote(symbol="FXY", name="Yen Currency Trust", price=60.19, change=-0.02, changePercentage=-0.03),
         ]
         result = service.format_forex(quotes)
 
-        # Render the table to a string for testing
-        console = Console(file=StringIO(), force_terminal=True, width=120)
-        console.print(result)
-        output = console.file.getvalue()
+        output = _table_text(result)
 
         assert "FXE" in output
         assert "Euro" in output
@@ -237,72 +262,43 @@ class TestDashboardService:
         }
         result = service.format_economic_stats(stats)
 
-        assert "ECONOMIC STATISTICS" in result
-        assert "GDP" in result
-        assert "Unemployment" in result
-        assert "3.70%" in result
+        expected = ("ECONOMIC STATISTICS", "GDP", "Unemployment", "3.70%")
+        missing = [token for token in expected if token not in result]
+        assert not missing, f"missing tokens: {missing}"
 
-    def test_format_volume_millions(self, service):
-        """Test volume formatting for millions."""
-        assert service._format_volume(125400000) == "125.4M"
-
-    def test_format_volume_billions(self, service):
-        """Test volume formatting for billions."""
-        assert service._format_volume(2500000000) == "2.5B"
-
-    def test_format_volume_thousands(self, service):
-        """Test volume formatting for thousands."""
-        assert service._format_volume(45000) == "45.0K"
-
-    def test_format_volume_small(self, service):
-        """Test volume formatting for small numbers."""
-        assert service._format_volume(500) == "500"
+    @pytest.mark.parametrize(
+        "volume, expected",
+        [
+            pytest.param(125400000, "125.4M", id="millions"),
+            pytest.param(2500000000, "2.5B", id="billions"),
+            pytest.param(45000, "45.0K", id="thousands"),
+            pytest.param(500, "500", id="small"),
+        ],
+    )
+    def test_format_volume(self, service, volume, expected):
+        """Test volume formatting picks the right unit suffix."""
+        assert service._format_volume(volume) == expected
 
 
 class TestInternationalBonds:
     """Tests for international bond methods in DashboardService."""
 
-    @pytest.fixture
-    def mock_fmp_client(self):
-        """Create a mock FMP client."""
-        return MagicMock()
-
-    @pytest.fixture
-    def mock_eodhd_client(self):
-        """Create a mock EODHD client."""
-        return MagicMock()
-
-    @pytest.fixture
-    def service(self, mock_fmp_client):
-        """Create DashboardService with mock FMP client only."""
-        return DashboardService(mock_fmp_client)
-
-    @pytest.fixture
-    def service_with_eodhd(self, mock_fmp_client, mock_eodhd_client):
-        """Create DashboardService with both FMP and EODHD clients."""
-        return DashboardService(mock_fmp_client, eodhd_client=mock_eodhd_client)
-
-    @pytest.mark.asyncio
     async def test_get_international_bond_snapshot(
         self, service_with_eodhd, mock_fmp_client, mock_eodhd_client
     ):
         """Test fetching international bond snapshot."""
         # Mock US treasury rates from FMP
-        mock_fmp_client.get_treasury_rates = AsyncMock(
-            return_value=(
-                {"month1": 4.50, "year5": 4.15, "year10": 4.28},
-                None,
-            )
+        mock_fmp_client.get_treasury_rates.return_value = (
+            {"month1": 4.50, "year5": 4.15, "year10": 4.28},
+            None,
         )
 
         # Mock international yields from EODHD
-        mock_eodhd_client.get_international_snapshot = AsyncMock(
-            return_value={
-                "CA": {"1M": 4.25, "5Y": 3.10, "10Y": 3.42},
-                "DE": {"5Y": 2.10, "10Y": 2.45},
-                "JP": {"5Y": 0.55, "10Y": 0.92},
-            }
-        )
+        mock_eodhd_client.get_international_snapshot.return_value = {
+            "CA": {"1M": 4.25, "5Y": 3.10, "10Y": 3.42},
+            "DE": {"5Y": 2.10, "10Y": 2.45},
+            "JP": {"5Y": 0.55, "10Y": 0.92},
+        }
 
         result = await service_with_eodhd.get_international_bond_snapshot()
 
@@ -313,14 +309,11 @@ class TestInternationalBonds:
         assert "DE" in result
         assert result["DE"]["10Y"] == 2.45
 
-    @pytest.mark.asyncio
     async def test_get_international_bond_snapshot_without_eodhd(
         self, service, mock_fmp_client
     ):
         """Test snapshot returns only US data when EODHD not configured."""
-        mock_fmp_client.get_treasury_rates = AsyncMock(
-            return_value=({"month1": 4.50, "year5": 4.15, "year10": 4.28}, None)
-        )
+        mock_fmp_client.get_treasury_rates.return_value = ({"month1": 4.50, "year5": 4.15, "year10": 4.28}, None)
 
         result = await service.get_international_bond_snapshot()
 
@@ -329,25 +322,22 @@ class TestInternationalBonds:
         # Should only have US data
         assert len(result) == 1
 
-    @pytest.mark.asyncio
     async def test_get_country_bond_detail_us(
         self, service_with_eodhd, mock_fmp_client
     ):
         """Test getting US bond detail uses FMP."""
-        mock_fmp_client.get_treasury_rates = AsyncMock(
-            return_value=(
-                {
-                    "month1": 4.50,
-                    "month3": 4.45,
-                    "month6": 4.40,
-                    "year1": 4.35,
-                    "year2": 4.25,
-                    "year5": 4.15,
-                    "year10": 4.28,
-                    "year30": 4.45,
-                },
-                {"year10": 4.25},  # Previous day for change calculation
-            )
+        mock_fmp_client.get_treasury_rates.return_value = (
+            {
+                "month1": 4.50,
+                "month3": 4.45,
+                "month6": 4.40,
+                "year1": 4.35,
+                "year2": 4.25,
+                "year5": 4.15,
+                "year10": 4.28,
+                "year30": 4.45,
+            },
+            {"year10": 4.25},  # Previous day for change calculation
         )
 
         result = await service_with_eodhd.get_country_bond_detail("US")
@@ -357,22 +347,19 @@ class TestInternationalBonds:
         assert result["yields"]["10Y"]["yield"] == 4.28
         mock_fmp_client.get_treasury_rates.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_get_country_bond_detail_international(
         self, service_with_eodhd, mock_eodhd_client
     ):
         """Test getting international bond detail uses EODHD."""
-        mock_eodhd_client.get_country_yields = AsyncMock(
-            return_value={
-                "3M": {"close": 2.10},
-                "6M": {"close": 2.15},
-                "1Y": {"close": 2.20},
-                "2Y": {"close": 2.25},
-                "5Y": {"close": 2.35},
-                "10Y": {"close": 2.45},
-                "30Y": {"close": 2.60},
-            }
-        )
+        mock_eodhd_client.get_country_yields.return_value = {
+            "3M": {"close": 2.10},
+            "6M": {"close": 2.15},
+            "1Y": {"close": 2.20},
+            "2Y": {"close": 2.25},
+            "5Y": {"close": 2.35},
+            "10Y": {"close": 2.45},
+            "30Y": {"close": 2.60},
+        }
 
         result = await service_with_eodhd.get_country_bond_detail("DE")
 
@@ -381,7 +368,6 @@ class TestInternationalBonds:
         assert result["yields"]["10Y"]["yield"] == 2.45
         mock_eodhd_client.get_country_yields.assert_called_once_with("DE")
 
-    @pytest.mark.asyncio
     async def test_get_country_bond_detail_unknown_country(self, service_with_eodhd):
         """Test unknown country returns None."""
         result = await service_with_eodhd.get_country_bond_detail("XX")
@@ -403,13 +389,17 @@ class TestInternationalBonds:
         }
         result = service.format_international_bond_snapshot(snapshot)
 
-        assert "INTERNATIONAL GOVERNMENT BOND YIELDS" in result
-        assert "United States" in result
-        assert "Germany" in result
-        assert "Japan" in result
-        assert "4.28" in result  # US 10Y
-        assert "2.45" in result  # DE 10Y
-        assert "0.92" in result  # JP 10Y
+        expected = (
+            "INTERNATIONAL GOVERNMENT BOND YIELDS",
+            "United States",
+            "Germany",
+            "Japan",
+            "4.28",  # US 10Y
+            "2.45",  # DE 10Y
+            "0.92",  # JP 10Y
+        )
+        missing = [token for token in expected if token not in result]
+        assert not missing, f"missing tokens: {missing}"
 
     def test_format_country_bond_detail_empty(self, service):
         """Test formatting empty country detail."""
@@ -441,95 +431,58 @@ class TestInternationalBonds:
 class TestMarketSnapshot:
     """Tests for market snapshot methods in DashboardService."""
 
-    @pytest.fixture
-    def mock_fmp_client(self):
-        """Create a mock FMP client."""
-        return MagicMock()
-
-    @pytest.fixture
-    def service(self, mock_fmp_client):
-        """Create DashboardService with mock FMP client."""
-        return DashboardService(mock_fmp_client)
-
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_commodity_quotes(self) -> list[Quote]:
         """Create sample commodity ETF quotes."""
-        return [
-            Quote(symbol="GLD", name="SPDR Gold Shares", price=185.45, change=0.83, changePercentage=0.45),
-            Quote(symbol="USO", name="United States Oil Fund", price=72.30, change=-0.89, changePercentage=-1.23),
-            Quote(symbol="SLV", name="iShares Silver Trust", price=22.15, change=0.07, changePercentage=0.32),
-            Quote(symbol="UNG", name="United States Natural Gas Fund", price=12.45, change=-0.27, changePercentage=-2.15),
-            Quote(symbol="DBA", name="Invesco DB Agriculture Fund", price=24.80, change=0.04, changePercentage=0.18),
-            Quote(symbol="URA", name="Global X Uranium ETF", price=28.50, change=0.42, changePercentage=1.50),
-        ]
+        return _quotes(_COMMODITY_ROWS)
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_sector_quotes(self) -> list[Quote]:
         """Create sample sector ETF quotes."""
-        return [
-            Quote(symbol="XLK", name="Technology Select Sector", price=195.42, change=2.31, changePercentage=1.2),
-            Quote(symbol="XLF", name="Financial Select Sector", price=42.15, change=0.34, changePercentage=0.8),
-            Quote(symbol="XLE", name="Energy Select Sector", price=87.30, change=-0.44, changePercentage=-0.5),
-            Quote(symbol="XLV", name="Health Care Select Sector", price=145.67, change=0.44, changePercentage=0.3),
-            Quote(symbol="XLY", name="Consumer Discretionary Select", price=182.45, change=1.09, changePercentage=0.6),
-            Quote(symbol="XLI", name="Industrial Select Sector", price=120.34, change=0.96, changePercentage=0.8),
-        ]
+        return _quotes(_SECTOR_ROWS)
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_index_quotes(self) -> list[Quote]:
         """Create sample index quotes for snapshot."""
-        return [
-            Quote(symbol="^GSPC", name="S&P 500", price=5234.18, change=23.45, changePercentage=0.45),
-            Quote(symbol="^DJI", name="Dow Jones", price=38654.42, change=123.45, changePercentage=0.32),
-            Quote(symbol="^IXIC", name="NASDAQ", price=16428.82, change=109.88, changePercentage=0.67),
-            Quote(symbol="^RUT", name="Russell 2000", price=2045.32, change=-3.07, changePercentage=-0.15),
-            Quote(symbol="^FTSE", name="FTSE 100", price=8125.45, change=26.00, changePercentage=0.32),
-            Quote(symbol="^GDAXI", name="DAX", price=18432.67, change=106.91, changePercentage=0.58),
-            Quote(symbol="^FCHI", name="CAC 40", price=7890.12, change=19.73, changePercentage=0.25),
-            Quote(symbol="^N225", name="Nikkei 225", price=38452.12, change=473.16, changePercentage=1.23),
-            Quote(symbol="^HSI", name="Hang Seng", price=17845.32, change=-80.30, changePercentage=-0.45),
-            Quote(symbol="^KS11", name="KOSPI", price=2654.78, change=21.77, changePercentage=0.82),
-        ]
-
-    @pytest.mark.asyncio
-    async def test_get_commodity_quotes(self, service, mock_fmp_client, sample_commodity_quotes):
-        """Test fetching commodity ETF quotes."""
-        mock_fmp_client.get_quotes = AsyncMock(return_value=sample_commodity_quotes)
-
-        result = await service.get_commodity_quotes()
-
-        assert len(result) == 6
-        symbols = [q.symbol for q in result]
-        assert "GLD" in symbols
-        assert "USO" in symbols
-        assert "URA" in symbols
-        mock_fmp_client.get_quotes.assert_called_once_with(["GLD", "USO", "SLV", "UNG", "DBA", "URA"])
-
-    @pytest.mark.asyncio
-    async def test_get_sector_quotes(self, service, mock_fmp_client, sample_sector_quotes):
-        """Test fetching sector ETF quotes."""
-        mock_fmp_client.get_quotes = AsyncMock(return_value=sample_sector_quotes)
+        return _quotes(_SNAPSHOT_INDEX_ROWS)
+
+    @pytest.mark.parametrize(
+        "method, expected_symbols, sample_fixture",
+        [
+            pytest.param(
+                "get_commodity_quotes",
+                ["GLD", "USO", "SLV", "UNG", "DBA", "URA"],
+                "sample_commodity_quotes",
+                id="commodities",
+            ),
+            pytest.param(
+                "get_sector_quotes",
+                ["XLK", "XLF", "XLE", "XLV", "XLY", "XLI"],
+                "sample_sector_quotes",
+                id="sectors",
+            ),
+        ],
+    )
+    async def test_get_etf_quotes(
+        self, request, service, mock_fmp_client, method, expected_symbols, sample_fixture
+    ):
+        """Test fetching commodity and sector ETF quotes."""
+        mock_fmp_client.get_quotes.return_value = request.getfixturevalue(sample_fixture)
 
-        result = await service.get_sector_quotes()
+        result = await getattr(service, method)()
 
-        assert len(result) == 6
-        symbols = [q.symbol for q in result]
-        assert "XLK" in symbols
-        assert "XLF" in symbols
-        mock_fmp_client.get_quotes.assert_called_once_with(["XLK", "XLF", "XLE", "XLV", "XLY", "XLI"])
+        assert [q.symbol for q in result] == expected_symbols
+        mock_fmp_client.get_quotes.assert_called_once_with(expected_symbols)
 
-    @pytest.mark.asyncio
     async def test_get_market_snapshot(
         self, service, mock_fmp_client, sample_index_quotes, sample_commodity_quotes, sample_sector_quotes
     ):
         """Test fetching complete market snapshot."""
-        mock_fmp_client.get_world_indices = AsyncMock(return_value=sample_index_quotes)
-        mock_fmp_client.get_quotes = AsyncMock(side_effect=[sample_commodity_quotes, sample_sector_quotes])
-        mock_fmp_client.get_treasury_rates = AsyncMock(
-            return_value=(
-                {"year2": 4.25, "year5": 4.15, "year10": 4.28, "year30": 4.45},
-                None,
-            )
+        mock_fmp_client.get_world_indices.return_value = sample_index_quotes
+        mock_fmp_client.get_quotes.side_effect = [sample_commodity_quotes, sample_sector_quotes]
+        mock_fmp_client.get_treasury_rates.return_value = (
+            {"year2": 4.25, "year5": 4.15, "year10": 4.28, "year30": 4.45},
+            None,
         )
 
         result = await service.get_market_snapshot()
@@ -559,32 +512,31 @@ class TestMarketSnapshot:
         }
         result = service.format_market_snapshot(snapshot)
 
-        # Check header
-        assert "MARKET SNAPSHOT" in result
-
-        # Check equity indices section
-        assert "EQUITY INDICES" in result
-        assert "S&P 500" in result
-        assert "+0.45%" in result
-        assert "NASDAQ" in result
-        assert "FTSE 100" in result
-        assert "Nikkei" in result
-
-        # Check commodities section
-        assert "COMMODITIES" in result
-        assert "Gold" in result
-        assert "Oil" in result
-
-        # Check sectors section
-        assert "SECTORS" in result
-        assert "Tech" in result
-        assert "Financials" in result
-
-        # Check bonds section
-        assert "BOND YIELDS" in result
-        assert "2Y" in result
-        assert "10Y" in result
-        assert "Spread" in result
+        expected = (
+            "MARKET SNAPSHOT",
+            # Equity indices section
+            "EQUITY INDICES",
+            "S&P 500",
+            "+0.45%",
+            "NASDAQ",
+            "FTSE 100",
+            "Nikkei",
+            # Commodities section
+            "COMMODITIES",
+            "Gold",
+            "Oil",
+            # Sectors section
+            "SECTORS",
+            "Tech",
+            "Financials",
+            # Bonds section
+            "BOND YIELDS",
+            "2Y",
+            "10Y",
+            "Spread",
+        )
+        missing = [token for token in expected if token not in result]
+        assert not missing, f"missing tokens: {missing}"
 
     def test_format_market_snapshot_colors(self, service):
         """Test that colors are applied correctly for gains/losses."""
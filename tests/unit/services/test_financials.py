@@ -1,7 +1,6 @@
 """Unit tests for financials service."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
 
 from boomberg.api.models import (
     BalanceSheet,
@@ -13,167 +12,202 @@ from boomberg.api.models import (
 from boomberg.services.financials import FinancialsService
 
 
+_SAMPLE_RATIOS = FinancialRatiosTTM(
+    symbol="AAPL",
+    gross_profit_margin=0.45,
+    operating_profit_margin=0.30,
+    net_profit_margin=0.25,
+    current_ratio=1.5,
+    quick_ratio=1.2,
+    cash_ratio=0.5,
+    pe_ratio=25.0,
+    peg_ratio=2.5,
+    price_to_book=10.0,
+    price_to_sales=5.0,
+    debt_ratio=0.3,
+    debt_to_equity=0.5,
+    interest_coverage=15.0,
+    dividend_yield=0.015,
+    payout_ratio=0.25,
+)
+
+_SAMPLE_METRICS = KeyMetricsTTM(
+    symbol="AAPL",
+    market_cap=2_500_000_000_000,
+    enterprise_value=2_600_000_000_000,
+    ev_to_sales=8.5,
+    ev_to_ebitda=20.0,
+    ev_to_free_cash_flow=25.0,
+    net_debt_to_ebitda=0.5,
+    roic=0.35,
+    roe=1.5,
+    roa=0.30,
+    working_capital=-5_000_000_000,
+    graham_number=50.0,
+)
+
+_SAMPLE_INCOME = IncomeStatement(
+    date="2024-09-30",
+    symbol="AAPL",
+    period="FY",
+    fiscal_year="2024",
+    revenue=400_000_000_000,
+    gross_profit=180_000_000_000,
+    operating_income=120_000_000_000,
+    net_income=100_000_000_000,
+    eps=6.50,
+    eps_diluted=6.45,
+    ebitda=130_000_000_000,
+)
+
+_SAMPLE_BALANCE_SHEET = BalanceSheet(
+    date="2024-09-30",
+    symbol="AAPL",
+    period="FY",
+    fiscal_year="2024",
+    total_assets=350_000_000_000,
+    total_current_assets=140_000_000_000,
+    cash_and_equivalents=30_000_000_000,
+    short_term_investments=35_000_000_000,
+    net_receivables=25_000_000_000,
+    inventory=5_000_000_000,
+    total_non_current_assets=210_000_000_000,
+    property_plant_equipment=45_000_000_000,
+    total_liabilities=280_000_000_000,
+    total_current_liabilities=150_000_000_000,
+    accounts_payable=60_000_000_000,
+    short_term_debt=10_000_000_000,
+    total_non_current_liabilities=130_000_000_000,
+    long_term_debt=100_000_000_000,
+    total_stockholders_equity=70_000_000_000,
+    retained_earnings=5_000_000_000,
+    total_debt=110_000_000_000,
+    net_debt=80_000_000_000,
+)
+
+_SAMPLE_CASH_FLOW = CashFlowStatement(
+    date="2024-09-30",
+    symbol="AAPL",
+    period="FY",
+    fiscal_year="2024",
+    net_income=100_000_000_000,
+    depreciation_amortization=12_000_000_000,
+    stock_based_compensation=10_000_000_000,
+    change_in_working_capital=-5_000_000_000,
+    operating_cash_flow=115_000_000_000,
+    capital_expenditure=-10_000_000_000,
+    acquisitions=-500_000_000,
+    purchases_of_investments=-40_000_000_000,
+    sales_of_investments=50_000_000_000,
+    investing_cash_flow=0,
+    debt_repayment=-10_000_000_000,
+    stock_repurchased=-80_000_000_000,
+    dividends_paid=-15_000_000_000,
+    financing_cash_flow=-105_000_000_000,
+    net_change_in_cash=10_000_000_000,
+    free_cash_flow=105_000_000_000,
+)
+
+
 class TestFinancialsService:
     """Tests for FinancialsService."""
 
     @pytest.fixture
-    def mock_client(self):
-        """Create mock FMP client."""
-        return MagicMock()
+    def mock_client(self, mock_fmp_client):
+        """Shared mock FMP client."""
+        return mock_fmp_client
 
     @pytest.fixture
     def service(self, mock_client):
         """Create financials service with mock client."""
         return FinancialsService(mock_client)
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_ratios(self) -> FinancialRatiosTTM:
         """Sample financial ratios."""
-        return FinancialRatiosTTM(
-            symbol="AAPL",
-            gross_profit_margin=0.45,
-            operating_profit_margin=0.30,
-            net_profit_margin=0.25,
-            current_ratio=1.5,
-            quick_ratio=1.2,
-            cash_ratio=0.5,
-            pe_ratio=25.0,
-            peg_ratio=2.5,
-            price_to_book=10.0,
-            price_to_sales=5.0,
-            debt_ratio=0.3,
-            debt_to_equity=0.5,
-            interest_coverage=15.0,
-            dividend_yield=0.015,
-            payout_ratio=0.25,
-        )
+        return _SAMPLE_RATIOS
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_metrics(self) -> KeyMetricsTTM:
         """Sample key metrics."""
-        return KeyMetricsTTM(
-            symbol="AAPL",
-            market_cap=2_500_000_000_000,
-            enterprise_value=2_600_000_000_000,
-            ev_to_sales=8.5,
-            ev_to_ebitda=20.0,
-            ev_to_free_cash_flow=25.0,
-            net_debt_to_ebitda=0.5,
-            roic=0.35,
-            roe=1.5,
-            roa=0.30,
-            working_capital=-5_000_000_000,
-            graham_number=50.0,
-        )
+        return _SAMPLE_METRICS
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_income(self) -> IncomeStatement:
         """Sample income statement."""
-        return IncomeStatement(
-            date="2024-09-30",
-            symbol="AAPL",
-            period="FY",
-            fiscal_year="2024",
-            revenue=400_000_000_000,
-            gross_profit=180_000_000_000,
-            operating_income=120_000_000_000,
-            net_income=100_000_000_000,
-            eps=6.50,
-            eps_diluted=6.45,
-            ebitda=130_000_000_000,
-        )
-
-    @pytest.mark.asyncio
+        return _SAMPLE_INCOME
+
     async def test_get_ratios(self, service, mock_client, sample_ratios):
         """Test getting financial ratios."""
-        mock_client.get_financial_ratios_ttm = AsyncMock(return_value=sample_ratios)
+        mock_client.get_financial_ratios_ttm.return_value = sample_ratios
         result = await service.get_ratios("AAPL")
         assert result.symbol == "AAPL"
         mock_client.get_financial_ratios_ttm.assert_called_once_with("AAPL")
 
-    @pytest.mark.asyncio
     async def test_get_key_metrics(self, service, mock_client, sample_metrics):
         """Test getting key metrics."""
-        mock_client.get_key_metrics_ttm = AsyncMock(return_value=sample_metrics)
+        mock_client.get_key_metrics_ttm.return_value = sample_metrics
         result = await service.get_key_metrics("AAPL")
         assert result.symbol == "AAPL"
         mock_client.get_key_metrics_ttm.assert_called_once_with("AAPL")
 
-    @pytest.mark.asyncio
     async def test_get_income_statement(self, service, mock_client, sample_income):
         """Test getting income statement."""
-        mock_client.get_income_statement = AsyncMock(return_value=[sample_income])
+        mock_client.get_income_statement.return_value = [sample_income]
         result = await service.get_income_statement("AAPL", limit=1)
         assert len(result) == 1
         assert result[0].symbol == "AAPL"
         mock_client.get_income_statement.assert_called_once_with("AAPL", 1, "annual")
 
-    def test_format_percent(self, service):
+    @pytest.mark.parametrize(
+        "value, expected",
+        [(0.25, "25.00%"), (0.123456, "12.35%"), (None, "N/A")],
+    )
+    def test_format_percent(self, service, value, expected):
         """Test percentage formatting."""
-        assert service.format_percent(0.25) == "25.00%"
-        assert service.format_percent(0.123456) == "12.35%"
-        assert service.format_percent(None) == "N/A"
+        assert service.format_percent(value) == expected
 
-    def test_format_ratio(self, service):
+    @pytest.mark.parametrize(
+        "value, expected",
+        [(25.5, "25.50"), (1.234567, "1.23"), (None, "N/A")],
+    )
+    def test_format_ratio(self, service, value, expected):
         """Test ratio formatting."""
-        assert service.format_ratio(25.5) == "25.50"
-        assert service.format_ratio(1.234567) == "1.23"
-        assert service.format_ratio(None) == "N/A"
-
-    def test_format_large_number_trillion(self, service):
-        """Test formatting trillion values."""
-        assert service.format_large_number(2_500_000_000_000) == "$2.50T"
-
-    def test_format_large_number_billion(self, service):
-        """Test formatting billion values."""
-        assert service.format_large_number(150_000_000_000) == "$150.00B"
-
-    def test_format_large_number_million(self, service):
-        """Test formatting million values."""
-        assert service.format_large_number(500_000_000) == "$500.00M"
-
-    def test_format_large_number_thousand(self, service):
-        """Test formatting thousand values."""
-        assert service.format_large_number(50_000) == "$50.00K"
-
-    def test_format_large_number_small(self, service):
-        """Test formatting small values."""
-        assert service.format_large_number(500) == "$500.00"
-
-    def test_format_large_number_negative(self, service):
-        """Test formatting negative values."""
-        assert service.format_large_number(-5_000_000_000) == "-$5.00B"
-
-    def test_format_large_number_none(self, service):
-        """Test formatting None values."""
-        assert service.format_large_number(None) == "N/A"
-
-    def test_format_currency(self, service):
+        assert service.format_ratio(value) == expected
+
+    @pytest.mark.parametrize(
+        "args, expected",
+        [
+            pytest.param((2_500_000_000_000,), "$2.50T", id="trillion"),
+            pytest.param((150_000_000_000,), "$150.00B", id="billion"),
+            pytest.param((500_000_000,), "$500.00M", id="million"),
+            pytest.param((50_000,), "$50.00K", id="thousand"),
+            pytest.param((500,), "$500.00", id="small"),
+            pytest.param((-5_000_000_000,), "-$5.00B", id="negative"),
+            pytest.param((None,), "N/A", id="none"),
+            pytest.param((2_500_000_000_000, "¥"), "¥2.50T", id="yen-trillion"),
+            pytest.param((150_000_000_000, "¥"), "¥150.00B", id="yen-billion"),
+            pytest.param((-5_000_000_000, "¥"), "-¥5.00B", id="yen-negative"),
+            pytest.param((500_000_000, "£"), "£500.00M", id="pound"),
+            pytest.param((50_000, "€"), "€50.00K", id="euro"),
+        ],
+    )
+    def test_format_large_number(self, service, args, expected):
+        """Test large number formatting with unit suffixes and currency symbols."""
+        assert service.format_large_number(*args) == expected
+
+    @pytest.mark.parametrize(
+        "args, expected",
+        [
+            pytest.param((123.45,), "$123.45", id="default"),
+            pytest.param((None,), "N/A", id="none"),
+            pytest.param((3774.0, "¥"), "¥3774.00", id="yen"),
+            pytest.param((114.15, "£"), "£114.15", id="pound"),
+        ],
+    )
+    def test_format_currency(self, service, args, expected):
         """Test currency formatting."""
-        assert service.format_currency(123.45) == "$123.45"
-        assert service.format_currency(None) == "N/A"
-
-    def test_format_large_number_with_yen(self, service):
-        """Test formatting large numbers with yen symbol."""
-        assert service.format_large_number(2_500_000_000_000, "¥") == "¥2.50T"
-        assert service.format_large_number(150_000_000_000, "¥") == "¥150.00B"
-        assert service.format_large_number(-5_000_000_000, "¥") == "-¥5.00B"
-
-    def test_format_large_number_with_pound(self, service):
-        """Test formatting large numbers with pound symbol."""
-        assert service.format_large_number(500_000_000, "£") == "£500.00M"
-
-    def test_format_large_number_with_euro(self, service):
-        """Test formatting large numbers with euro symbol."""
-        assert service.format_large_number(50_000, "€") == "€50.00K"
-
-    def test_format_currency_with_yen(self, service):
-        """Test currency formatting with yen symbol."""
-        assert service.format_currency(3774.0, "¥") == "¥3774.00"
-
-    def test_format_currency_with_pound(self, service):
-        """Test currency formatting with pound symbol."""
-        assert service.format_currency(114.15, "£") == "£114.15"
+        assert service.format_currency(*args) == expected
 
     def test_get_ratios_summary(self, service, sample_ratios):
         """Test getting ratios summary."""
@@ -208,73 +242,27 @@ class TestFinancialsService:
         assert summary["Net Income"] == "$100.00B"
         assert summary["EPS"] == "$6.50"
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_balance_sheet(self) -> BalanceSheet:
         """Sample balance sheet."""
-        return BalanceSheet(
-            date="2024-09-30",
-            symbol="AAPL",
-            period="FY",
-            fiscal_year="2024",
-            total_assets=350_000_000_000,
-            total_current_assets=140_000_000_000,
-            cash_and_equivalents=30_000_000_000,
-            short_term_investments=35_000_000_000,
-            net_receivables=25_000_000_000,
-            inventory=5_000_000_000,
-            total_non_current_assets=210_000_000_000,
-            property_plant_equipment=45_000_000_000,
-            total_liabilities=280_000_000_000,
-            total_current_liabilities=150_000_000_000,
-            accounts_payable=60_000_000_000,
-            short_term_debt=10_000_000_000,
-            total_non_current_liabilities=130_000_000_000,
-            long_term_debt=100_000_000_000,
-            total_stockholders_equity=70_000_000_000,
-            retained_earnings=5_000_000_000,
-            total_debt=110_000_000_000,
-            net_debt=80_000_000_000,
-        )
+        return _SAMPLE_BALANCE_SHEET
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_cash_flow(self) -> CashFlowStatement:
         """Sample cash flow statement."""
-        return CashFlowStatement(
-            date="2024-09-30",
-            symbol="AAPL",
-            period="FY",
-            fiscal_year="2024",
-            net_income=100_000_000_000,
-            depreciation_amortization=12_000_000_000,
-            stock_based_compensation=10_000_000_000,
-            change_in_working_capital=-5_000_000_000,
-            operating_cash_flow=115_000_000_000,
-            capital_expenditure=-10_000_000_000,
-            acquisitions=-500_000_000,
-            purchases_of_investments=-40_000_000_000,
-            sales_of_investments=50_000_000_000,
-            investing_cash_flow=0,
-            debt_repayment=-10_000_000_000,
-            stock_repurchased=-80_000_000_000,
-            dividends_paid=-15_000_000_000,
-            financing_cash_flow=-105_000_000_000,
-            net_change_in_cash=10_000_000_000,
-            free_cash_flow=105_000_000_000,
-        )
-
-    @pytest.mark.asyncio
+        return _SAMPLE_CASH_FLOW
+
     async def test_get_balance_sheet(self, service, mock_client, sample_balance_sheet):
         """Test getting balance sheet."""
-        mock_client.get_balance_sheet = AsyncMock(return_value=[sample_balance_sheet])
+        mock_client.get_balance_sheet.return_value = [sample_balance_sheet]
         result = await service.get_balance_sheet("AAPL", limit=1)
         assert len(result) == 1
         assert result[0].symbol == "AAPL"
         mock_client.get_balance_sheet.assert_called_once_with("AAPL", 1, "annual")
 
-    @pytest.mark.asyncio
     async def test_get_cash_flow_statement(self, service, mock_client, sample_cash_flow):
         """Test getting cash flow statement."""
-        mock_client.get_cash_flow_statement = AsyncMock(return_value=[sample_cash_flow])
+        mock_client.get_cash_flow_statement.return_value = [sample_cash_flow]
         result = await service.get_cash_flow_statement("AAPL", limit=1)
         assert len(result) == 1
         assert result[0].symbol == "AAPL"
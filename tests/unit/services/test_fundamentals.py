@@ -1,81 +1,79 @@
 """Unit tests for FundamentalsService."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
 
 from boomberg.api.models import CompanyProfile
 from boomberg.services.fundamentals import FundamentalsService
 
 
+_SAMPLE_PROFILE = CompanyProfile(
+    symbol="AAPL",
+    company_name="Apple Inc.",
+    exchange="NASDAQ",
+    industry="Consumer Electronics",
+    sector="Technology",
+    description="Apple designs and manufactures smartphones.",
+    ceo="Tim Cook",
+    website="https://www.apple.com",
+    market_cap=2890000000000,
+    price=185.50,
+    country="US",
+    city="Cupertino",
+    employees=164000,
+)
+
+
 class TestFundamentalsService:
     """Tests for FundamentalsService."""
 
     @pytest.fixture
-    def mock_client(self):
-        """Create a mock FMP client."""
-        return MagicMock()
+    def mock_client(self, mock_fmp_client):
+        """Shared mock FMP client."""
+        return mock_fmp_client
 
     @pytest.fixture
     def service(self, mock_client):
         """Create FundamentalsService with mock client."""
         return FundamentalsService(mock_client)
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_profile(self) -> CompanyProfile:
         """Create a sample company profile."""
-        return CompanyProfile(
-            symbol="AAPL",
-            company_name="Apple Inc.",
-            exchange="NASDAQ",
-            industry="Consumer Electronics",
-            sector="Technology",
-            description="Apple designs and manufactures smartphones.",
-            ceo="Tim Cook",
-            website="https://www.apple.com",
-            market_cap=2890000000000,
-            price=185.50,
-            country="US",
-            city="Cupertino",
-            employees=164000,
-        )
-
-    @pytest.mark.asyncio
+        return _SAMPLE_PROFILE
+
     async def test_get_profile(self, service, mock_client, sample_profile):
         """Test fetching company profile."""
-        mock_client.get_company_profile = AsyncMock(return_value=sample_profile)
+        mock_client.get_company_profile.return_value = sample_profile
 
         result = await service.get_profile("AAPL")
 
         assert result == sample_profile
         mock_client.get_company_profile.assert_called_once_with("AAPL")
 
-    def test_format_market_cap_trillion(self, service):
-        """Test market cap formatting for trillions."""
-        assert service.format_market_cap(2890000000000) == "$2.89T"
-
-    def test_format_market_cap_billion(self, service):
-        """Test market cap formatting for billions."""
-        assert service.format_market_cap(150000000000) == "$150.00B"
-
-    def test_format_market_cap_million(self, service):
-        """Test market cap formatting for millions."""
-        assert service.format_market_cap(500000000) == "$500.00M"
-
-    def test_format_market_cap_none(self, service):
-        """Test market cap formatting for None."""
-        assert service.format_market_cap(None) == "N/A"
-
-    def test_format_employees_thousands(self, service):
-        """Test employee count formatting for thousands."""
-        assert service.format_employees(164000) == "164.0K"
-
-    def test_format_employees_small(self, service):
-        """Test employee count formatting for small numbers."""
-        assert service.format_employees(500) == "500"
-
-    def test_format_employees_none(self, service):
-        """Test employee count formatting for None."""
-        assert service.format_employees(None) == "N/A"
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            pytest.param(2890000000000, "$2.89T", id="trillion"),
+            pytest.param(150000000000, "$150.00B", id="billion"),
+            pytest.param(500000000, "$500.00M", id="million"),
+            pytest.param(None, "N/A", id="none"),
+        ],
+    )
+    def test_format_market_cap(self, service, value, expected):
+        """Test market cap formatting."""
+        assert service.format_market_cap(value) == expected
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            pytest.param(164000, "164.0K", id="thousands"),
+            pytest.param(500, "500", id="small"),
+            pytest.param(None, "N/A", id="none"),
+        ],
+    )
+    def test_format_employees(self, service, value, expected):
+        """Test employee count formatting."""
+        assert service.format_employees(value) == expected
 
     def test_get_profile_summary(self, service, sample_profile):
         """Test getting profile summary."""
@@ -36,7 +36,7 @@ class TestPortfolioWidget:
     def test_portfolio_shows_cost_column_not_price(self, sample_holding):
         """Test that portfolio displays Cost column header, not Price."""
         widget = PortfolioWidget()
-        widget._holdings = [sample_holding]
+        widget.update_holdings([sample_holding])
 
         # Render to string
         console = Console(file=StringIO(), force_terminal=True, width=120)
@@ -51,7 +51,7 @@ class TestPortfolioWidget:
     def test_portfolio_shows_total_cost_value(self, sample_holding):
         """Test that portfolio displays the total cost of the position."""
         widget = PortfolioWidget()
-        widget._holdings = [sample_holding]
+        widget.update_holdings([sample_holding])
 
         # Render to string
         console = Console(file=StringIO(), force_terminal=True, width=120)
@@ -65,7 +65,7 @@ class TestPortfolioWidget:
     def test_gain_loss_shows_only_percent(self, sample_holding):
         """Test that gain/loss column shows only percentage, not dollar value."""
         widget = PortfolioWidget()
-        widget._holdings = [sample_holding]
+        widget.update_holdings([sample_holding])
 
         # Render to string
         console = Console(file=StringIO(), force_terminal=True, width=120)
@@ -99,7 +99,7 @@ class TestPortfolioWidget:
             exchange="CRYPTO",
         )
         widget = PortfolioWidget()
-        widget._holdings = [holding]
+        widget.update_holdings([holding])
 
         # Render to string
         console = Console(file=StringIO(), force_terminal=True, width=120)
@@ -113,7 +113,7 @@ class TestPortfolioWidget:
     def test_no_total_row(self, sample_holding):
         """Test that portfolio does not show a TOTAL row."""
         widget = PortfolioWidget()
-        widget._holdings = [sample_holding]
+        widget.update_holdings([sample_holding])
 
         # Render to string
         console = Console(file=StringIO(), force_terminal=True, width=120)
@@ -183,7 +183,7 @@ class TestPortfolioWidget:
 
         widget = PortfolioWidget()
         # Add in wrong order
-        widget._holdings = [low_value, high_value, mid_value]
+        widget.update_holdings([low_value, high_value, mid_value])
 
         # Render to string
         console = Console(file=StringIO(), force_terminal=True, width=120)
@@ -6,7 +6,7 @@ from io import StringIO
 from rich.console import Console
 
 from boomberg.api.models import NewsArticle, Quote
-from boomberg.ui.widgets.quote_panel import QuotePanel, PriceChanges
+from boomberg.ui.widgets.quote_panel import QuotePanel, PriceChanges, get_currency_symbol
 
 
 class TestQuotePanelNews:
@@ -178,3 +178,70 @@ class TestQuotePanelNews:
         # Should NOT show items 4 and 5
         assert "News item 3" not in output
         assert "News item 4" not in output
+
+
+class TestQuotePanelRenderCache:
+    """Tests for QuotePanel renderable caching."""
+
+    @pytest.fixture
+    def sample_quote(self) -> Quote:
+        """Sample quote for testing."""
+        return Quote(
+            symbol="AAPL",
+            name="Apple Inc.",
+            price=175.50,
+            change=2.50,
+            change_percent=1.45,
+            exchange="NASDAQ",
+        )
+
+    def test_render_reuses_table_for_same_quote(self, sample_quote):
+        """Test repeated renders return the same renderable."""
+        widget = QuotePanel()
+        widget.update_quote(sample_quote)
+
+        assert widget.render() is widget.render()
+
+    def test_update_quote_invalidates_cache(self, sample_quote):
+        """Test updating the quote rebuilds the renderable."""
+        widget = QuotePanel()
+        widget.update_quote(sample_quote)
+        first = widget.render()
+
+        widget.update_quote(sample_quote.model_copy(update={"price": 180.0}))
+        second = widget.render()
+
+        assert second is not first
+        console = Console(file=StringIO(), force_terminal=True, width=100)
+        console.print(second)
+        assert "180.00" in console.file.getvalue()
+
+
+class TestGetCurrencySymbol:
+    """Tests for exchange to currency symbol lookup."""
+
+    def test_direct_match(self):
+        """Test exact exchange names map to their currency."""
+        assert get_currency_symbol("NASDAQ") == "$"
+        assert get_currency_symbol("LSE") == "£"
+        assert get_currency_symbol("HKEX") == "HK$"
+
+    def test_case_insensitive_match(self):
+        """Test exchange names match regardless of case."""
+        assert get_currency_symbol("xetra") == "€"
+        assert get_currency_symbol("tokyo") == "¥"
+
+    def test_prefix_match(self):
+        """Test exchange names sharing a key's first three letters match."""
+        assert get_currency_symbol("Toronto Stock Exchange") == "C$"
+        assert get_currency_symbol("Shenzhen Stock Exchange") == "¥"
+
+    def test_partial_match(self):
+        """Test longer exchange names match on a contained key."""
+        assert get_currency_symbol("Deutsche Borse XETRA") == "€"
+        assert get_currency_symbol("Korea Exchange") == "₩"
+
+    def test_unknown_or_empty_defaults_to_usd(self):
+        """Test unknown and empty exchanges default to USD."""
+        assert get_currency_symbol("") == "$"
+        assert get_currency_symbol("Unknown Exchange") == "$"
@@ -3,7 +3,7 @@
 import pytest
 
 from boomberg.api.models import Quote
-from boomberg.ui.widgets.snapshot import SnapshotWidget
+from boomberg.ui.widgets.snapshot import SnapshotWidget, _extract_treasury_yields
 
 
 class TestSnapshotWidget:
@@ -91,6 +91,25 @@ class TestSnapshotWidget:
         # Should return a Panel with content
         assert result is not None
 
+    def test_render_reuses_renderable_until_update(self, widget, sample_indices, sample_commodities, sample_sectors, sample_bonds):
+        """Test that repeated renders reuse the cached renderable."""
+        widget.update_snapshot(
+            indices=sample_indices,
+            commodities=sample_commodities,
+            sectors=sample_sectors,
+            bonds=sample_bonds,
+        )
+        first = widget.render()
+        assert widget.render() is first
+
+        widget.update_snapshot(
+            indices=sample_indices,
+            commodities=[],
+            sectors=[],
+            bonds={},
+        )
+        assert widget.render() is not first
+
     def test_format_change_positive(self, widget):
         """Test formatting positive change."""
         text = widget._format_change(1.23)
@@ -108,3 +127,22 @@ class TestSnapshotWidget:
         text = widget._format_change(0.0)
         assert "+0.00%" in str(text)
         assert text.style == "green"
+
+
+class TestExtractTreasuryYields:
+    """Tests for mapping treasury responses onto tenor labels."""
+
+    def test_maps_alternative_keys(self):
+        """Test alternative key spellings map to their tenor."""
+        yields = _extract_treasury_yields({"twoYear": 4.1, "y10": 4.3, "month1": 5.0})
+        assert yields == {"2Y": 4.1, "10Y": 4.3}
+
+    def test_prefers_earlier_alternative(self):
+        """Test the most preferred key wins regardless of response order."""
+        yields = _extract_treasury_yields({"2Y": 9.9, "year2": 4.25})
+        assert yields["2Y"] == 4.25
+
+    def test_skips_none_values(self):
+        """Test missing values fall back to other alternatives."""
+        yields = _extract_treasury_yields({"year5": None, "fiveYear": 4.15, "year30": None})
+        assert yields == {"5Y": 4.15}
@@ -0,0 +1,51 @@
+"""Unit tests for ticker tape widget."""
+
+import pytest
+
+from boomberg.api.models import Quote
+from boomberg.ui.widgets.ticker_tape import TickerTape
+
+
+class TestTickerTape:
+    """Tests for TickerTape."""
+
+    @pytest.fixture
+    def sample_quotes(self) -> list[Quote]:
+        """Sample quotes for testing."""
+        return [
+            Quote(symbol="AAPL", name="Apple Inc.", price=175.50, change=2.50, change_percent=1.45),
+            Quote(symbol="MSFT", name="Microsoft", price=410.25, change=-3.10, change_percent=-0.75),
+        ]
+
+    def test_render_empty(self):
+        """Test that an empty tape shows a placeholder."""
+        widget = TickerTape()
+        assert widget.render().plain == "No market data"
+
+    def test_render_quotes(self, sample_quotes):
+        """Test that quotes are rendered into the tape."""
+        widget = TickerTape()
+        widget.update_quotes(sample_quotes)
+
+        assert widget.render().plain == "AAPL $175.50 +1.45%  |  MSFT $410.25 -0.75%"
+
+    def test_scroll_tick_reuses_tape(self, sample_quotes):
+        """Test that scrolling does not rebuild the tape."""
+        widget = TickerTape()
+        widget.update_quotes(sample_quotes)
+        first = widget.render()
+
+        widget.scroll_tick()
+
+        assert widget.render() is first
+
+    def test_update_quotes_rebuilds_tape(self, sample_quotes):
+        """Test that new quotes replace the cached tape."""
+        widget = TickerTape()
+        widget.update_quotes(sample_quotes)
+        first = widget.render()
+
+        widget.update_quotes(sample_quotes[:1])
+
+        assert widget.render() is not first
+        assert "MSFT" not in widget.render().plain
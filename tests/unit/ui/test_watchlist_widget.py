@@ -0,0 +1,65 @@
+"""Unit tests for watchlist widget."""
+
+import pytest
+from io import StringIO
+from rich.console import Console
+
+from boomberg.services.watchlist import WatchlistQuote
+from boomberg.ui.widgets.watchlist import WatchlistWidget
+
+
+class TestWatchlistWidget:
+    """Tests for WatchlistWidget."""
+
+    @pytest.fixture
+    def sample_quote(self) -> WatchlistQuote:
+        """Sample watchlist quote for testing."""
+        return WatchlistQuote(
+            symbol="AAPL",
+            name="Apple Inc.",
+            price=175.50,
+            change=2.50,
+            change_percent=1.45,
+            volume=50000000,
+            exchange="NASDAQ",
+            market_cap=2800000000000,
+            pe=28.5,
+            change_1d=1.45,
+            change_1m=-3.2,
+            change_ytd=12.0,
+        )
+
+    def _render_to_string(self, widget: WatchlistWidget) -> str:
+        """Render widget to a plain string."""
+        console = Console(file=StringIO(), force_terminal=True, width=120)
+        console.print(widget.render())
+        return console.file.getvalue()
+
+    def test_render_empty(self):
+        """Test that an empty watchlist shows the empty message."""
+        widget = WatchlistWidget()
+        widget.set_empty_message("Nothing here")
+        assert "Nothing here" in self._render_to_string(widget)
+
+    def test_render_row(self, sample_quote):
+        """Test that a quote row shows formatted values."""
+        widget = WatchlistWidget()
+        widget.update_quotes([sample_quote])
+        output = self._render_to_string(widget)
+
+        assert "AAPL" in output
+        assert "$2.8T" in output
+        assert "28.5" in output
+        assert "+1.4%" in output
+        assert "-3.2%" in output
+        assert "50.0M" in output
+
+    def test_render_reuses_renderable_until_update(self, sample_quote):
+        """Test that repeated renders reuse the cached renderable."""
+        widget = WatchlistWidget()
+        widget.update_quotes([sample_quote])
+        first = widget.render()
+        assert widget.render() is first
+
+        widget.update_quotes([])
+        assert widget.render() is not first
@@ -0,0 +1,49 @@
+"""Unit tests for shared widget formatting helpers."""
+
+from boomberg.ui.widgets._formatting import (
+    VOLUME_SCALES,
+    format_market_cap,
+    format_volume,
+    humanize,
+)
+
+
+class TestHumanize:
+    """Tests for humanize."""
+
+    def test_picks_largest_reached_scale(self):
+        """Test that the first threshold reached is used."""
+        assert humanize(2_500_000_000, VOLUME_SCALES) == "2.50B"
+        assert humanize(45_000, VOLUME_SCALES, precision=1) == "45.0K"
+
+    def test_below_all_scales(self):
+        """Test that values below every threshold return None."""
+        assert humanize(500, VOLUME_SCALES) is None
+
+
+class TestFormatMarketCap:
+    """Tests for format_market_cap."""
+
+    def test_scales(self):
+        """Test trillion, billion and million market caps."""
+        assert format_market_cap(2_800_000_000_000) == "$2.80T"
+        assert format_market_cap(45_600_000_000, "€") == "€45.60B"
+        assert format_market_cap(750_000_000, precision=1) == "$750.0M"
+
+    def test_small_value(self):
+        """Test that small market caps are shown in full."""
+        assert format_market_cap(950_000) == "$950,000"
+
+
+class TestFormatVolume:
+    """Tests for format_volume."""
+
+    def test_scales(self):
+        """Test billion, million and thousand volumes."""
+        assert format_volume(1_200_000_000) == "1.20B"
+        assert format_volume(125_400_000, precision=1) == "125.4M"
+        assert format_volume(45_000) == "45.00K"
+
+    def test_small_value(self):
+        """Test that small volumes are shown in full."""
+        assert format_volume(500) == "500"
@@ -133,6 +133,15 @@ class TestPredictionWidget:
         # Volume should be formatted
         assert "125.4K" in output or "89.2K" in output
 
+    def test_render_reuses_renderable_until_update(self, widget, sample_market, sample_markets):
+        """Test that render returns the cached renderable until data changes."""
+        widget.update_markets(sample_markets)
+        first = widget.render()
+        assert widget.render() is first
+
+        widget.update_detail(sample_market)
+        assert widget.render() is not first
+
     def test_widget_clears_detail_on_update_markets(self, widget, sample_market, sample_markets):
         """Test that updating markets clears detail view."""
         widget.update_detail(sample_market)